@@ -49,11 +49,11 @@ except ImportError:
 # Import graph components
 try:
     from ..graph.build import build_graph
-    from ..graph.state import ITGraphState, RequestStatus, DecisionType
+    from ..graph.state import ITGraphState, RequestStatus, DecisionType, serialize_state
 except ImportError:
     # Fallback for direct execution
     from src.graph.build import build_graph
-from src.graph.state import ITGraphState, RequestStatus, DecisionType
+from src.graph.state import ITGraphState, RequestStatus, DecisionType, serialize_state
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -539,14 +539,14 @@ async def stream_events(ticket_id: str):
         if ticket_id in app_state.active_tickets:
             existing_events = app_state.active_tickets[ticket_id].get('events', [])
             for event in existing_events[-5:]:  # Send last 5 events
-                yield f"data: {json.dumps(event)}\n\n"
+                yield f"data: {serialize_state(event).decode()}\n\n"
         
         try:
             while True:
                 # Wait for events with timeout
                 try:
                     event = await asyncio.wait_for(queue.get(), timeout=10.0)
-                    yield f"data: {json.dumps(event)}\n\n"
+                    yield f"data: {serialize_state(event).decode()}\n\n"
                 except asyncio.TimeoutError:
                     # Send keepalive and check if ticket still exists
                     if ticket_id not in app_state.active_tickets:
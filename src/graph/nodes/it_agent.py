@@ -8,15 +8,18 @@ This node executes what is executable from the plan:
 - Return execution outcome status
 """
 
+import hashlib
 import json
 import logging
+import time
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
 
 from ..state import (
-    ITGraphState, PlanRecord, PlanStep, TicketRecord, DecisionType, ActorType
+    ITGraphState, PlanRecord, PlanStep, TicketRecord, DecisionType, ActorType,
+    serialize_state
 )
 # Mock clients for testing without full configuration
 class MockEmailClient:
@@ -45,6 +48,16 @@ TOOLS_AVAILABLE = False
 logger = logging.getLogger(__name__)
 
 
+# Completion criteria keyed by (has_employee_steps, has_manager_steps)
+_COMMON_CRITERIA = ("All required documentation submitted", "No pending questions or clarifications")
+_COMPLETION_CRITERIA = {
+    (False, False): _COMMON_CRITERIA,
+    (True, False): ("All employee steps completed",) + _COMMON_CRITERIA,
+    (False, True): ("All manager approvals obtained",) + _COMMON_CRITERIA,
+    (True, True): ("All employee steps completed", "All manager approvals obtained") + _COMMON_CRITERIA,
+}
+
+
 class ExecutionOutcome(str, Enum):
     """Possible execution outcomes"""
     EXECUTED = "executed"
@@ -52,9 +65,15 @@ class ExecutionOutcome(str, Enum):
     AWAITING_MANAGER = "awaiting_manager"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ExecutableAction:
     """Represents an action that can be executed"""
+    # Explicit __slots__ rather than slots=True so Python 3.9 stays supported
+    __slots__ = (
+        "step_id", "action_type", "tool", "parameters",
+        "preconditions_met", "estimated_duration", "automation_level"
+    )
+    
     step_id: str
     action_type: str
     tool: str
@@ -67,6 +86,8 @@ class ExecutableAction:
 @dataclass
 class UserGuide:
     """User guide for manual steps"""
+    __slots__ = ("title", "introduction", "steps", "completion_criteria", "next_steps")
+    
     title: str
     introduction: str
     steps: List[Dict[str, Any]]
@@ -242,17 +263,11 @@ class UserGuideGenerator:
         user_request = state.get("user_request", {})
         request_title = user_request.get("title", "your request")
         
-        intro_parts = [f"To proceed with {request_title}, you need to complete the following steps:"]
+        base = f"To proceed with {request_title}, you need to complete the following steps:"
+        emp = f" • {len(employee_steps)} step(s) that you can complete" if employee_steps else ""
+        mgr = f" • {len(manager_steps)} step(s) requiring manager approval" if manager_steps else ""
         
-        if employee_steps:
-            intro_parts.append(f"• {len(employee_steps)} step(s) that you can complete")
-        
-        if manager_steps:
-            intro_parts.append(f"• {len(manager_steps)} step(s) requiring manager approval")
-        
-        intro_parts.append("Please complete all steps in the order shown below.")
-        
-        return " ".join(intro_parts)
+        return f"{base}{emp}{mgr} Please complete all steps in the order shown below."
     
     def _generate_steps(self, steps: List[PlanStep]) -> List[Dict[str, Any]]:
         """Generate step-by-step instructions"""
@@ -295,20 +310,7 @@ class UserGuideGenerator:
     def _generate_completion_criteria(self, employee_steps: List[PlanStep], 
                                     manager_steps: List[PlanStep]) -> List[str]:
         """Generate completion criteria"""
-        criteria = []
-        
-        if employee_steps:
-            criteria.append("All employee steps completed")
-        
-        if manager_steps:
-            criteria.append("All manager approvals obtained")
-        
-        criteria.extend([
-            "All required documentation submitted",
-            "No pending questions or clarifications"
-        ])
-        
-        return criteria
+        return list(_COMPLETION_CRITERIA[(bool(employee_steps), bool(manager_steps))])
     
     def _generate_next_steps(self, state: ITGraphState) -> str:
         """Generate next steps description"""
@@ -347,12 +349,20 @@ class ITAgentNode:
             executable_steps = self._identify_executable_steps(steps, state)
             manual_steps = self._identify_manual_steps(steps, state)
             
-            # Execute automated steps
+            # Execute automated steps, dispatching identical tool calls only once
             execution_results = []
+            seen: Dict[bytes, Tuple[str, Dict[str, Any]]] = {}
             for step in executable_steps:
                 action = self._create_executable_action(step)
                 if action.preconditions_met:
-                    result = self.execution_engine.execute_action(action, state)
+                    action_hash = self._action_hash(action)
+                    if action_hash in seen:
+                        first_step_id, first_result = seen[action_hash]
+                        logger.info(f"Skipping duplicate action {action.step_id} (same as {first_step_id})")
+                        result = {**first_result, "action_id": action.step_id, "duplicate_of": first_step_id}
+                    else:
+                        result = self.execution_engine.execute_action(action, state)
+                        seen[action_hash] = (action.step_id, result)
                     execution_results.append(result)
                 else:
                     logger.warning(f"Preconditions not met for step {step.get('step_id')}")
@@ -375,18 +385,16 @@ class ITAgentNode:
             
         except Exception as e:
             logger.error(f"Error in IT Agent execution: {e}")
-            # Add error to state
-            if "errors" not in state:
-                state["errors"] = []
-            state["errors"].append({
-                "error_id": f"it_agent_error_{datetime.now().timestamp()}",
+            # Add error to a copy of the state, leaving the caller's untouched
+            error_record = {
+                "error_id": f"it_agent_error_{time.time_ns()}",
                 "timestamp": datetime.now(),
                 "error_type": "it_agent_execution_error",
                 "message": str(e),
                 "severity": "high",
                 "resolved": False
-            })
-            return state, ExecutionOutcome.EXECUTED
+            }
+            return {**state, "errors": state.get("errors", []) + [error_record]}, ExecutionOutcome.EXECUTED
     
     def _identify_executable_steps(self, steps: List[PlanStep], state: ITGraphState) -> List[PlanStep]:
         """Identify steps that can be executed automatically"""
@@ -450,6 +458,12 @@ class ITAgentNode:
             automation_level="fully_automated" if step.get("automation_possible") else "semi_automated"
         )
     
+    def _action_hash(self, action: ExecutableAction) -> bytes:
+        """Content hash of an action's tool and parameters, used to collapse duplicates"""
+        # Parameter dicts built in a different key order are still the same action
+        payload = serialize_state((action.tool, action.parameters), sort_keys=True)
+        return hashlib.blake2b(payload, digest_size=16).digest()
+    
     def _determine_ticket_status(self, executable_steps: List[PlanStep], 
                                 manual_steps: List[PlanStep], state: ITGraphState) -> str:
         """Determine the appropriate ticket status"""
@@ -470,28 +484,26 @@ class ITAgentNode:
     def _update_state_with_results(self, state: ITGraphState, execution_results: List[Dict[str, Any]], 
                                   user_guide: Optional[UserGuide], ticket_status: str) -> ITGraphState:
         """Update state with execution results and user guide"""
-        # Add execution results to state
-        if "execution_results" not in state:
-            state["execution_results"] = []
-        state["execution_results"].extend(execution_results)
+        # Build the delta once and merge it, rather than mutating state key by key
+        now = datetime.now()
+        delta = {"execution_results": state.get("execution_results", []) + execution_results}
         
         # Add user guide to state if generated
         if user_guide:
-            state["user_guide"] = {
+            delta["user_guide"] = {
                 "title": user_guide.title,
                 "introduction": user_guide.introduction,
                 "steps": user_guide.steps,
                 "completion_criteria": user_guide.completion_criteria,
                 "next_steps": user_guide.next_steps,
-                "generated_at": datetime.now().isoformat()
+                "generated_at": now.isoformat()
             }
         
         # Update ticket status
         if "ticket_record" in state:
-            state["ticket_record"]["status"] = ticket_status
-            state["ticket_record"]["updated_at"] = datetime.now()
+            delta["ticket_record"] = {**state["ticket_record"], "status": ticket_status, "updated_at": now}
         
-        return state
+        return {**state, **delta}
     
     def _determine_outcome(self, executable_steps: List[PlanStep], 
                           manual_steps: List[PlanStep], state: ITGraphState) -> ExecutionOutcome:
@@ -571,22 +583,22 @@ def it_agent_node(state: ITGraphState) -> ITGraphState:
     except Exception as e:
         logger.error(f"Error in IT Agent node: {e}")
         
-        # Add error to state
-        if "errors" not in state:
-            state["errors"] = []
-        state["errors"].append({
-            "error_id": f"it_agent_node_error_{datetime.now().timestamp()}",
+        # Build the error delta and merge it, as the success path does
+        error_record = {
+            "error_id": f"it_agent_node_error_{time.time_ns()}",
             "timestamp": datetime.now(),
             "error_type": "it_agent_node_error",
             "message": str(e),
             "severity": "high",
             "resolved": False
-        })
-        
-        # Set default outcome
-        state["it_outcome"] = ExecutionOutcome.EXECUTED
+        }
+        delta = {
+            "errors": state.get("errors", []) + [error_record],
+            # Set default outcome
+            "it_outcome": ExecutionOutcome.EXECUTED
+        }
         
-        return state
+        return {**state, **delta}
 
 
 # Convenience functions for testing and direct usage
@@ -6,10 +6,13 @@ creates PlanRecord objects, persists them to the database, and handles
 manager approval requirements by attaching email drafts to tickets.
 """
 
+import asyncio
 import json
+import logging
+import os
 import re
-import uuid
-from typing import List, Dict, Any, Optional, Tuple
+from functools import lru_cache, partial
+from typing import Callable, List, Dict, Any, FrozenSet, Optional, Tuple, Union
 from datetime import datetime
 from dataclasses import dataclass
 
@@ -18,9 +21,128 @@ from ..state import (
     DecisionRecord, DecisionType, PriorityLevel, ActorType
 )
 from ...models.llm_registry import get_llm
-from ...store.db import save_plan_from_record, get_ticket, update_ticket_status
+from ...store.db import save_plan_from_record, save_plans_from_records, get_ticket, update_ticket_status
 from ...tools.emailer import Emailer
 
+logger = logging.getLogger(__name__)
+
+# orjson is optional; fall back to the stdlib json module for planner I/O
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON text; orjson.JSONDecodeError subclasses json.JSONDecodeError"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _dumps(payload: Dict[str, Any]) -> str:
+    """Serialize the planner input as compact JSON text (no indentation, so fewer prompt tokens)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload).decode('utf-8')
+    return json.dumps(payload, separators=(',', ':'), ensure_ascii=False)
+
+
+# Fenced ```json block, and the outermost {...} span for unfenced responses
+_JSON_BLOCK_RE = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+_JSON_BRACE_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+
+# Mock planner responses; {approval} is filled in once per variant at import,
+# leaving str.format_map placeholders (string values must be JSON-encoded)
+_MOCK_TMPL = """
+```json
+{{
+  "plan_id": "{plan_id}",
+  "request_summary": {request_summary},
+  "classification": "{classification}",
+  "priority": "{priority}",
+  "estimated_duration": "{estimated_duration}",
+  "steps": [
+    {{
+      "step_id": "step_1",
+      "order": 1,
+      "description": "Review request and validate requirements",
+      "actor": "it_agent",
+      "actor_details": "IT Support Agent",
+      "required_tools": ["ticketing_system", "policy_database"],
+      "preconditions": ["request_initialized"],
+      "postconditions": ["requirements_validated"],
+      "estimated_duration": "30",
+      "data_privacy_notes": "Standard request processing",
+      "dependencies": [],
+      "automation_possible": true,
+      "fallback_actor": "senior_agent"
+    }}
+  ],
+__APPROVAL__
+  "risk_assessment": {{
+    "risk_level": "MEDIUM",
+    "risks": ["Standard operational risk"],
+    "mitigation_strategies": ["Follow established procedures"],
+    "rollback_plan": "Standard rollback procedures"
+  }},
+  "compliance_checklist": [
+    "Policy_compliance_verified",
+    "Audit_trail_created"
+  ],
+  "success_criteria": [
+    "Request processed within SLA",
+    "All approvals documented",
+    "Compliance requirements met"
+  ]
+}}
+```
+"""
+
+_MOCK_TMPL_APPROVAL = _MOCK_TMPL.replace('__APPROVAL__', """  "approval_workflow": {{
+    "needed": true,
+    "approvers": ["IT_Manager"],
+    "approval_order": "sequential",
+    "escalation_path": ["IT_Director"],
+    "timeout_hours": 24
+  }},
+  "email_draft": {{
+    "subject": {email_subject},
+    "recipients": ["it.manager@company.com"],
+    "cc": ["it.director@company.com"],
+    "body": "Please review and approve this IT request.",
+    "attachments": [],
+    "urgency_note": "Standard processing time"
+  }},""")
+
+_MOCK_TMPL_NO_APPROVAL = _MOCK_TMPL.replace('__APPROVAL__', """  "approval_workflow": {{
+    "needed": false,
+    "approvers": [],
+    "approval_order": "none",
+    "escalation_path": [],
+    "timeout_hours": 0
+  }},
+  "email_draft": {{
+    "subject": {email_subject},
+    "recipients": [],
+    "cc": [],
+    "body": "",
+    "attachments": [],
+    "urgency_note": "Standard processing time"
+  }},""")
+
+
+@lru_cache(maxsize=4)
+def _load_prompt(path: str) -> str:
+    """Read a prompt file once per process and keep its text in memory"""
+    try:
+        with open(path, 'r') as f:
+            return f.read()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Planner prompt not found at {path}")
+
 
 @dataclass
 class PlanningInput:
@@ -54,12 +176,8 @@ class PlannerPromptCaller:
     def call_planner(self, input_data: PlanningInput, 
                      target_model: str) -> str:
         """Call the planner LLM with the prompt and input data"""
-        # Read planner prompt
-        try:
-            with open(self.planner_prompt_path, 'r') as f:
-                planner_prompt = f.read()
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Planner prompt not found at {self.planner_prompt_path}")
+        # Read planner prompt (cached after the first call)
+        planner_prompt = _load_prompt(self.planner_prompt_path)
         
         # Prepare prompt input
         prompt_input = self._prepare_prompt_input(input_data)
@@ -77,11 +195,7 @@ class PlannerPromptCaller:
                 else:
                     # Use LLM registry
                     llm = get_llm("planner")
-                    messages = [
-                        {"role": "system", "content": planner_prompt},
-                        {"role": "user", "content": json.dumps(prompt_input, indent=2)}
-                    ]
-                    response = llm.invoke(messages)
+                    response = llm.invoke(self._messages(planner_prompt, prompt_input))
                     return response.content
                     
             except Exception as e:
@@ -92,50 +206,114 @@ class PlannerPromptCaller:
         
         raise Exception("Failed to get planner response after all retries")
     
+    async def acall_planner(self, input_data: PlanningInput, 
+                            target_model: str) -> str:
+        """Async counterpart of call_planner, awaiting llm.ainvoke when the registry LLM has it"""
+        llm = None if self.llm_client else get_llm("planner")
+        if llm is None or not hasattr(llm, 'ainvoke'):
+            return await asyncio.to_thread(self.call_planner, input_data, target_model)
+        
+        planner_prompt = _load_prompt(self.planner_prompt_path)
+        messages = self._messages(planner_prompt, self._prepare_prompt_input(input_data))
+        
+        # Call LLM with retries
+        for attempt in range(self.max_retries):
+            try:
+                response = await llm.ainvoke(messages)
+                return response.content
+            except Exception as e:
+                if attempt == self.max_retries - 1:
+                    raise e
+                # Retry on failure
+                continue
+        
+        raise Exception("Failed to get planner response after all retries")
+    
+    def call_planner_many(self, inputs: List[PlanningInput],
+                          target_models: List[str]) -> List[Union[str, Exception]]:
+        """
+        Call the planner for several inputs, returning a response or the raised error for each.
+        
+        With the LLM registry this is a single batched request; inputs whose
+        batch element failed are retried one by one through call_planner.
+        """
+        llm = None if self.llm_client else get_llm("planner")
+        if llm is None or not hasattr(llm, 'batch'):
+            return [self._call_or_error(input_data, model) for input_data, model in zip(inputs, target_models)]
+        
+        planner_prompt = _load_prompt(self.planner_prompt_path)
+        responses = llm.batch(
+            [self._messages(planner_prompt, self._prepare_prompt_input(input_data)) for input_data in inputs],
+            return_exceptions=True
+        )
+        return [
+            self._call_or_error(input_data, model) if isinstance(response, Exception) else response.content
+            for input_data, model, response in zip(inputs, target_models, responses)
+        ]
+    
+    def _call_or_error(self, input_data: PlanningInput, target_model: str) -> Union[str, Exception]:
+        """call_planner, returning the final error instead of raising it"""
+        try:
+            return self.call_planner(input_data, target_model)
+        except Exception as e:
+            return e
+    
+    def _messages(self, planner_prompt: str, prompt_input: Dict[str, Any]) -> List[Dict[str, str]]:
+        """Chat messages for one planner call"""
+        return [
+            {"role": "system", "content": planner_prompt},
+            {"role": "user", "content": _dumps(prompt_input)}
+        ]
+    
     def _prepare_prompt_input(self, input_data: PlanningInput) -> Dict[str, Any]:
         """Prepare input data for planner prompt"""
+        ur_get = input_data.user_request.get
+        dr_get = input_data.decision_record.get
+        
         # Format retrieved documents
-        formatted_docs = []
-        for doc in input_data.retrieved_docs:
-            formatted_docs.append({
+        formatted_docs = [
+            {
                 'title': doc.get('title', ''),
-                'content': doc.get('content', '')[:1000],  # Limit content length
+                'content': (doc.get('content') or '')[:1000],  # Limit content length
                 'source': doc.get('source', ''),
                 'document_type': doc.get('document_type', ''),
                 'relevance_score': doc.get('relevance_score', 0.0)
-            })
+            }
+            for doc in input_data.retrieved_docs
+        ]
         
         # Format past tickets features
-        formatted_tickets = []
-        for ticket in input_data.past_tickets_features:
-            formatted_tickets.append({
+        formatted_tickets = [
+            {
                 'category': ticket.get('category', ''),
                 'resolution': ticket.get('resolution', ''),
                 'decision': ticket.get('decision', ''),
                 'similarity_score': ticket.get('similarity_score', 0.0)
-            })
+            }
+            for ticket in input_data.past_tickets_features
+        ]
         
         return {
             'request_details': {
-                'title': input_data.user_request.get('title', ''),
-                'description': input_data.user_request.get('description', ''),
-                'category': input_data.user_request.get('category', ''),
-                'priority': input_data.user_request.get('priority', ''),
-                'department': input_data.user_request.get('department', ''),
-                'urgency': input_data.user_request.get('urgency', '')
+                'title': ur_get('title', ''),
+                'description': ur_get('description', ''),
+                'category': ur_get('category', ''),
+                'priority': ur_get('priority', ''),
+                'department': ur_get('department', ''),
+                'urgency': ur_get('urgency', '')
             },
             'classifier_json': {
-                'decision': input_data.decision_record.get('decision', ''),
+                'decision': dr_get('decision', ''),
                 'citations': [
                     {
                         'source': citation.get('source', ''),
                         'text': citation.get('text', ''),
                         'relevance': citation.get('relevance', '')
                     }
-                    for citation in input_data.decision_record.get('citations', [])
+                    for citation in dr_get('citations', ())
                 ],
-                'missing_fields': input_data.decision_record.get('missing_fields', []),
-                'confidence': input_data.decision_record.get('confidence', 0.0)
+                'missing_fields': dr_get('missing_fields', []),
+                'confidence': dr_get('confidence', 0.0)
             },
             'relevant_policies': formatted_docs,
             'past_ticket_patterns': formatted_tickets
@@ -158,78 +336,27 @@ class PlannerPromptCaller:
             estimated_duration = 2
             needs_approval = False
         
-        mock_response = f"""
-```json
-{{
-  "plan_id": "PLAN_{uuid.uuid4().hex[:8].upper()}",
-  "request_summary": "Process {category} request for {input_data.user_request.get('title', 'IT request')}",
-  "classification": "{classification}",
-  "priority": "{priority}",
-  "estimated_duration": "{estimated_duration}",
-  "steps": [
-    {{
-      "step_id": "step_1",
-      "order": 1,
-      "description": "Review request and validate requirements",
-      "actor": "it_agent",
-      "actor_details": "IT Support Agent",
-      "required_tools": ["ticketing_system", "policy_database"],
-      "preconditions": ["request_initialized"],
-      "postconditions": ["requirements_validated"],
-      "estimated_duration": "30",
-      "data_privacy_notes": "Standard request processing",
-      "dependencies": [],
-      "automation_possible": true,
-      "fallback_actor": "senior_agent"
-    }}
-  ],
-  "approval_workflow": {{
-    "needed": {str(needs_approval).lower()},
-    "approvers": ["IT_Manager"] if {needs_approval} else [],
-    "approval_order": "sequential" if {needs_approval} else "none",
-    "escalation_path": ["IT_Director"] if {needs_approval} else [],
-    "timeout_hours": 24 if {needs_approval} else 0
-  }},
-  "email_draft": {{
-    "subject": "Approval Required: {input_data.user_request.get('title', 'IT Request')}",
-    "recipients": ["it.manager@company.com"] if {needs_approval} else [],
-    "cc": ["it.director@company.com"] if {needs_approval} else [],
-    "body": "Please review and approve this IT request." if {needs_approval} else "",
-    "attachments": [],
-    "urgency_note": "Standard processing time"
-  }},
-  "risk_assessment": {{
-    "risk_level": "MEDIUM",
-    "risks": ["Standard operational risk"],
-    "mitigation_strategies": ["Follow established procedures"],
-    "rollback_plan": "Standard rollback procedures"
-  }},
-  "compliance_checklist": [
-    "Policy_compliance_verified",
-    "Audit_trail_created"
-  ],
-  "success_criteria": [
-    "Request processed within SLA",
-    "All approvals documented",
-    "Compliance requirements met"
-  ]
-}}
-```
-"""
-        return mock_response
+        template = _MOCK_TMPL_APPROVAL if needs_approval else _MOCK_TMPL_NO_APPROVAL
+        return template.format_map({
+            'plan_id': f"PLAN_{os.urandom(4).hex().upper()}",
+            'request_summary': json.dumps(f"Process {category} request for {input_data.user_request.get('title', 'IT request')}"),
+            'classification': classification,
+            'priority': priority,
+            'estimated_duration': estimated_duration,
+            'email_subject': json.dumps(f"Approval Required: {input_data.user_request.get('title', 'IT Request')}")
+        })
 
 
 class JSONResponseParser:
     """Parses and validates JSON responses from planner LLM"""
     
-    def __init__(self):
-        self.required_fields = [
-            'plan_id', 'request_summary', 'classification', 'priority', 
-            'estimated_duration', 'steps', 'approval_workflow', 'email_draft',
-            'risk_assessment', 'compliance_checklist', 'success_criteria'
-        ]
-        self.valid_classifications = ['ALLOWED', 'DENIED', 'REQUIRES_APPROVAL']
-        self.valid_priorities = ['LOW', 'MEDIUM', 'HIGH', 'CRITICAL']
+    CLASSIFICATIONS: FrozenSet[str] = frozenset({'ALLOWED', 'DENIED', 'REQUIRES_APPROVAL'})
+    PRIORITIES: FrozenSet[str] = frozenset({'LOW', 'MEDIUM', 'HIGH', 'CRITICAL'})
+    ACTORS: FrozenSet[str] = frozenset({'it_agent', 'employee', 'manager_approval', 'system'})
+    # Ordered, since missing step fields are reported in this order
+    REQUIRED_STEP_FIELDS: Tuple[str, ...] = (
+        'step_id', 'order', 'description', 'actor', 'actor_details', 'estimated_duration'
+    )
     
     def parse_response(self, response: str) -> Tuple[bool, Optional[Dict[str, Any]], List[str]]:
         """Parse LLM response and return success, data, and validation errors"""
@@ -238,124 +365,132 @@ class JSONResponseParser:
         if not json_data:
             return False, None, ["No JSON found in response"]
         
-        # Validate JSON structure
-        validation_errors = self._validate_json_structure(json_data)
+        # Validate structure and field values in one pass
+        validation_errors = self._validate(json_data)
         if validation_errors:
             return False, json_data, validation_errors
         
-        # Validate field values
-        value_errors = self._validate_field_values(json_data)
-        if value_errors:
-            return False, json_data, value_errors
-        
         return True, json_data, []
     
     def _extract_json(self, response: str) -> Optional[Dict[str, Any]]:
         """Extract JSON from LLM response"""
         # Try to find JSON block
-        json_match = re.search(r'```json\s*(.*?)\s*```', response, re.DOTALL)
+        json_match = _JSON_BLOCK_RE.search(response)
         if json_match:
             json_str = json_match.group(1).strip()
             try:
-                return json.loads(json_str)
+                return _loads(json_str)
             except json.JSONDecodeError:
                 pass
         
         # Try to find JSON without markdown
         try:
             # Look for JSON-like content
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            if json_start >= 0 and json_end > json_start:
-                json_str = response[json_start:json_end]
-                return json.loads(json_str)
+            brace_match = _JSON_BRACE_RE.search(response)
+            if brace_match:
+                return _loads(brace_match.group(0))
         except json.JSONDecodeError:
             pass
         
         return None
     
-    def _validate_json_structure(self, data: Dict[str, Any]) -> List[str]:
-        """Validate that all required fields are present"""
-        errors = []
+    def _validate(self, data: Dict[str, Any]) -> List[str]:
+        """
+        Check required fields and their values in a single pass.
         
-        for field in self.required_fields:
+        Missing fields are reported on their own; value errors are only
+        reported once every required field is present.
+        """
+        missing = []
+        errors = []
+        for field, check in self._FIELD_TABLE.items():
             if field not in data:
-                errors.append(f"Missing required field: {field}")
+                missing.append(f"Missing required field: {field}")
+            elif check is not None and not missing:
+                errors.extend(check(self, data[field]))
         
-        return errors
+        return missing or errors
     
-    def _validate_field_values(self, data: Dict[str, Any]) -> List[str]:
-        """Validate field values meet requirements"""
-        errors = []
-        
-        # Validate classification
-        if 'classification' in data:
-            if data['classification'] not in self.valid_classifications:
-                errors.append(f"Invalid classification: {data['classification']}. Must be one of {self.valid_classifications}")
-        
-        # Validate priority
-        if 'priority' in data:
-            if data['priority'] not in self.valid_priorities:
-                errors.append(f"Invalid priority: {data['priority']}. Must be one of {self.valid_priorities}")
+    def _check_classification(self, value: Any) -> List[str]:
+        """Validate the plan classification"""
+        if not isinstance(value, str) or value not in self.CLASSIFICATIONS:
+            return [f"Invalid classification: {value}. Must be one of {sorted(self.CLASSIFICATIONS)}"]
+        return []
+    
+    def _check_priority(self, value: Any) -> List[str]:
+        """Validate the plan priority"""
+        if not isinstance(value, str) or value not in self.PRIORITIES:
+            return [f"Invalid priority: {value}. Must be one of {sorted(self.PRIORITIES)}"]
+        return []
+    
+    def _check_estimated_duration(self, value: Any) -> List[str]:
+        """Validate that estimated_duration is a non-negative number"""
+        try:
+            duration = float(value)
+        except (ValueError, TypeError):
+            return [f"Invalid estimated_duration: {value}. Must be a number"]
+        if duration < 0:
+            return [f"Invalid estimated_duration: {duration}. Must be non-negative"]
+        return []
+    
+    def _check_steps(self, steps: Any) -> List[str]:
+        """Validate the steps list and each step in it"""
+        if not isinstance(steps, list):
+            return ["Steps must be a list"]
+        if len(steps) == 0:
+            return ["At least one step is required"]
         
-        # Validate estimated_duration
-        if 'estimated_duration' in data:
-            try:
-                duration = float(data['estimated_duration'])
-                if duration < 0:
-                    errors.append(f"Invalid estimated_duration: {duration}. Must be non-negative")
-            except (ValueError, TypeError):
-                errors.append(f"Invalid estimated_duration: {data['estimated_duration']}. Must be a number")
-        
-        # Validate steps
-        if 'steps' in data:
-            if not isinstance(data['steps'], list):
-                errors.append("Steps must be a list")
-            elif len(data['steps']) == 0:
-                errors.append("At least one step is required")
+        errors = []
+        for i, step in enumerate(steps):
+            if not isinstance(step, dict):
+                errors.append(f"Step {i} must be a dictionary")
             else:
-                for i, step in enumerate(data['steps']):
-                    if not isinstance(step, dict):
-                        errors.append(f"Step {i} must be a dictionary")
-                    else:
-                        step_errors = self._validate_step(step, i)
-                        errors.extend(step_errors)
-        
-        # Validate approval_workflow
-        if 'approval_workflow' in data:
-            workflow = data['approval_workflow']
-            if not isinstance(workflow, dict):
-                errors.append("Approval workflow must be a dictionary")
-            elif 'needed' in workflow and not isinstance(workflow['needed'], bool):
-                errors.append("Approval workflow 'needed' must be a boolean")
-        
+                errors.extend(self._validate_step(step, i))
         return errors
     
+    def _check_approval_workflow(self, workflow: Any) -> List[str]:
+        """Validate the approval workflow shape"""
+        if not isinstance(workflow, dict):
+            return ["Approval workflow must be a dictionary"]
+        if 'needed' in workflow and not isinstance(workflow['needed'], bool):
+            return ["Approval workflow 'needed' must be a boolean"]
+        return []
+    
+    # Required top-level fields, in reporting order, with their value checks
+    _FIELD_TABLE: Dict[str, Optional[Callable[['JSONResponseParser', Any], List[str]]]] = {
+        'plan_id': None,
+        'request_summary': None,
+        'classification': _check_classification,
+        'priority': _check_priority,
+        'estimated_duration': _check_estimated_duration,
+        'steps': _check_steps,
+        'approval_workflow': _check_approval_workflow,
+        'email_draft': None,
+        'risk_assessment': None,
+        'compliance_checklist': None,
+        'success_criteria': None,
+    }
+    REQUIRED_FIELDS: FrozenSet[str] = frozenset(_FIELD_TABLE)
+    
     def _validate_step(self, step: Dict[str, Any], index: int) -> List[str]:
-        """Validate individual step structure"""
+        """Validate individual step structure and values in one pass over its fields"""
+        missing = []
         errors = []
-        required_step_fields = ['step_id', 'order', 'description', 'actor', 'actor_details', 'estimated_duration']
-        
-        for field in required_step_fields:
+        for field in self.REQUIRED_STEP_FIELDS:
             if field not in step:
-                errors.append(f"Step {index} missing required field: {field}")
-        
-        # Validate actor type
-        if 'actor' in step:
-            valid_actors = ['it_agent', 'employee', 'manager_approval', 'system']
-            if step['actor'] not in valid_actors:
-                errors.append(f"Step {index} has invalid actor: {step['actor']}. Must be one of {valid_actors}")
-        
-        # Validate order
-        if 'order' in step:
-            try:
-                order = int(step['order'])
-                if order < 1:
-                    errors.append(f"Step {index} has invalid order: {order}. Must be positive")
-            except (ValueError, TypeError):
-                errors.append(f"Step {index} has invalid order: {step['order']}. Must be an integer")
+                missing.append(f"Step {index} missing required field: {field}")
+            elif field == 'actor':
+                if not isinstance(step['actor'], str) or step['actor'] not in self.ACTORS:
+                    errors.append(f"Step {index} has invalid actor: {step['actor']}. Must be one of {sorted(self.ACTORS)}")
+            elif field == 'order':
+                try:
+                    order = int(step['order'])
+                    if order < 1:
+                        errors.append(f"Step {index} has invalid order: {order}. Must be positive")
+                except (ValueError, TypeError):
+                    errors.append(f"Step {index} has invalid order: {step['order']}. Must be an integer")
         
-        return errors
+        return missing + errors
 
 
 class PlanRepository:
@@ -363,16 +498,11 @@ class PlanRepository:
     
     def __init__(self, storage_client=None):
         self.storage_client = storage_client
-        self.plans = []  # In-memory storage for testing
+        self.plans: Dict[str, PlanRecord] = {}  # In-memory storage for testing, keyed by plan_id
     
     def persist_plan(self, plan_record: PlanRecord, ticket_id: str = None, request_id: str = None, created_by: str = None) -> str:
         """Persist plan record and return record ID"""
-        # Generate unique ID if not provided
-        if not plan_record.get('plan_id'):
-            plan_record['plan_id'] = f"plan_{uuid.uuid4().hex[:8].upper()}"
-        
-        # Add metadata
-        plan_record['persisted_at'] = datetime.now()
+        self._stamp(plan_record, datetime.now())
         
         # Store plan using database if ticket_id is provided
         if ticket_id and request_id and created_by:
@@ -380,16 +510,56 @@ class PlanRepository:
                 db_plan = save_plan_from_record(plan_record, ticket_id, request_id, created_by)
                 return db_plan.plan_id
             except Exception as e:
-                print(f"Failed to save plan to database: {e}")
+                logger.error("Failed to save plan to database: %s", e)
                 # Fallback to in-memory storage
         
-        # Store plan
+        return self._store(plan_record)
+    
+    def persist_plans(self, entries: List[Tuple[PlanRecord, Optional[str], Optional[str], Optional[str]]]) -> List[str]:
+        """
+        Persist several (plan_record, ticket_id, request_id, created_by) entries.
+        
+        Entries tied to a ticket are written to the database in one
+        transaction; the rest, or all of them if that fails, go to storage.
+        """
+        now = datetime.now()
+        for plan_record, *_ in entries:
+            self._stamp(plan_record, now)
+        
+        db_indices = [i for i, (_, ticket_id, request_id, created_by) in enumerate(entries)
+                      if ticket_id and request_id and created_by]
+        plan_ids: List[Optional[str]] = [None] * len(entries)
+        if db_indices:
+            try:
+                db_plans = save_plans_from_records([entries[i] for i in db_indices])
+                for i, db_plan in zip(db_indices, db_plans):
+                    plan_ids[i] = db_plan.plan_id
+            except Exception as e:
+                logger.error("Failed to save plans to database: %s", e)
+                # Fallback to in-memory storage
+        
+        return [
+            plan_id if plan_id is not None else self._store(plan_record)
+            for plan_id, (plan_record, *_) in zip(plan_ids, entries)
+        ]
+    
+    def _stamp(self, plan_record: PlanRecord, now: datetime) -> None:
+        """Assign an ID if needed and record the persist time"""
+        # Generate unique ID if not provided
+        if not plan_record.get('plan_id'):
+            plan_record['plan_id'] = f"plan_{os.urandom(4).hex().upper()}"
+        
+        # Add metadata
+        plan_record['persisted_at'] = now
+    
+    def _store(self, plan_record: PlanRecord) -> str:
+        """Write a plan to the storage client, or keep it in memory"""
         if self.storage_client:
             # Real storage implementation
             self.storage_client.store('plans', plan_record['plan_id'], plan_record)
         else:
             # In-memory storage for testing
-            self.plans.append(plan_record)
+            self.plans[plan_record['plan_id']] = plan_record
         
         return plan_record['plan_id']
     
@@ -399,10 +569,39 @@ class PlanRepository:
             return self.storage_client.retrieve('plans', plan_id)
         else:
             # In-memory lookup
-            for plan in self.plans:
-                if plan.get('plan_id') == plan_id:
-                    return plan
-        return None
+            return self.plans.get(plan_id)
+
+
+_APPROVAL_BODY_TMPL = """
+{body}
+
+Request Details:
+- Request ID: {request_id}
+- Title: {title}
+- Category: {category}
+- Priority: {priority}
+- Department: {department}
+- Submitted By: {submitted_by}
+- Submitted At: {submitted_at}
+- Estimated Duration: {estimated_duration} hours
+- Risk Level: {risk_level}
+
+Approval Details:
+- Required Approvers: {approvers}
+- Timeout: {timeout_hours} hours
+- Escalation Path: {escalation_path}
+
+{urgency_note}
+
+Please review and approve or deny this request within the specified timeframe.
+"""
+
+
+class _RequestContextFields(dict):
+    """Request context mapping that renders absent template fields as 'N/A'"""
+    
+    def __missing__(self, key: str) -> str:
+        return 'N/A'
 
 
 class ApprovalManager:
@@ -475,14 +674,14 @@ class ApprovalManager:
             
             if success:
                 # Log successful email
-                print(f"Approval email sent successfully for ticket {ticket_id}")
+                logger.info("Approval email sent successfully for ticket %s", ticket_id)
             else:
-                print(f"Failed to send approval email for ticket {ticket_id}")
+                logger.warning("Failed to send approval email for ticket %s", ticket_id)
             
             return success
             
         except Exception as e:
-            print(f"Error sending approval email: {e}")
+            logger.error("Error sending approval email: %s", e)
             return False
     
     def _format_approval_email_body(self, email_draft: Dict[str, Any]) -> str:
@@ -490,31 +689,297 @@ class ApprovalManager:
         request_context = email_draft.get('request_context', {})
         approval_details = email_draft.get('approval_details', {})
         
-        body = f"""
-{email_draft.get('body', '')}
+        params = _RequestContextFields(request_context)
+        params.update(
+            body=email_draft.get('body', ''),
+            urgency_note=email_draft.get('urgency_note', ''),
+            approvers=', '.join(approval_details.get('approvers', [])),
+            timeout_hours=approval_details.get('timeout_hours', 24),
+            escalation_path=', '.join(approval_details.get('escalation_path', []))
+        )
+        return _APPROVAL_BODY_TMPL.format_map(params).strip()
 
-Request Details:
-- Request ID: {request_context.get('request_id', 'N/A')}
-- Title: {request_context.get('title', 'N/A')}
-- Category: {request_context.get('category', 'N/A')}
-- Priority: {request_context.get('priority', 'N/A')}
-- Department: {request_context.get('department', 'N/A')}
-- Submitted By: {request_context.get('submitted_by', 'N/A')}
-- Submitted At: {request_context.get('submitted_at', 'N/A')}
-- Estimated Duration: {request_context.get('estimated_duration', 'N/A')} hours
-- Risk Level: {request_context.get('risk_level', 'N/A')}
 
-Approval Details:
-- Required Approvers: {', '.join(approval_details.get('approvers', []))}
-- Timeout: {approval_details.get('timeout_hours', 24)} hours
-- Escalation Path: {', '.join(approval_details.get('escalation_path', []))}
+# Stateless planner components shared by every invocation. PlanRepository keeps
+# in-memory plans, so each invocation still gets its own.
+_PROMPT_CALLER = PlannerPromptCaller()
+_PARSER = JSONResponseParser()
+_APPROVAL = ApprovalManager()
 
-{email_draft.get('urgency_note', '')}
 
-Please review and approve or deny this request within the specified timeframe.
-        """
+# Enum members by value, so plans and steps skip the Enum constructor lookup
+_ACTOR_MAP: Dict[str, ActorType] = {actor.value: actor for actor in ActorType}
+_DECISION_MAP: Dict[str, DecisionType] = {decision.value: decision for decision in DecisionType}
+_PRIORITY_MAP: Dict[str, PriorityLevel] = {priority.value: priority for priority in PriorityLevel}
+
+
+def _plan_step(step: Dict[str, Any]) -> PlanStep:
+    """Build a PlanStep from one validated step of the planner response"""
+    get = step.get
+    return PlanStep(
+        step_id=step['step_id'],
+        order=step['order'],
+        description=step['description'],
+        actor=_ACTOR_MAP[step['actor']],
+        actor_details=step['actor_details'],
+        required_tools=list(get('required_tools', ())),
+        preconditions=list(get('preconditions', ())),
+        postconditions=list(get('postconditions', ())),
+        estimated_duration=int(step['estimated_duration']),
+        data_privacy_notes=get('data_privacy_notes', ''),
+        dependencies=list(get('dependencies', ())),
+        automation_possible=get('automation_possible', False),
+        fallback_actor=get('fallback_actor')
+    )
+
+
+def _planning_input(state: ITGraphState) -> PlanningInput:
+    """Collect the planner inputs carried in the workflow state"""
+    return PlanningInput(
+        user_request=state.get('user_request', {}),
+        decision_record=state.get('decision_record', {}),
+        retrieved_docs=state.get('retrieved_docs', []),
+        past_tickets_features=state.get('metadata', {}).get('past_tickets', []),
+        employee=state.get('employee', {})
+    )
+
+
+def _target_model(state: ITGraphState) -> str:
+    """Target model from router verdict or the default"""
+    return state.get('router_verdict', {}).get('target_model', 'planner_model_v1')
+
+
+def _plan_owner(state: ITGraphState) -> Tuple[Optional[str], Optional[str], str]:
+    """(ticket_id, request_id, created_by) a plan is persisted under"""
+    return (
+        state.get('ticket_record', {}).get('ticket_id'),
+        state.get('user_request', {}).get('request_id'),
+        state.get('employee', {}).get('employee_id', 'system')
+    )
+
+
+# Fixed content of the fallback (unparseable response) and emergency (unexpected
+# error) plans. Nested sequences are tuples so the shared constants cannot be
+# mutated; plans get copies with lists (see _plan_section), as state.py types them.
+_FALLBACK_APPROVAL_WORKFLOW: Dict[str, Any] = {'needed': True, 'approvers': ('IT_Manager',), 'approval_order': 'sequential', 'escalation_path': ('IT_Director',), 'timeout_hours': 24}
+_FALLBACK_EMAIL_DRAFT: Dict[str, Any] = {'subject': 'Manual Review Required', 'recipients': (), 'cc': (), 'body': 'Manual review required due to planning system error', 'attachments': (), 'urgency_note': 'Immediate attention required'}
+_FALLBACK_RISK_ASSESSMENT: Dict[str, Any] = {'risk_level': 'HIGH', 'risks': ('Planning system error',), 'mitigation_strategies': ('Manual review',), 'rollback_plan': 'Manual intervention'}
+_FALLBACK_COMPLIANCE_CHECKLIST: Tuple[str, ...] = ('Manual_review_required',)
+_FALLBACK_SUCCESS_CRITERIA: Tuple[str, ...] = ('Manual review completed', 'Plan validated')
+
+_EMERGENCY_APPROVAL_WORKFLOW: Dict[str, Any] = {'needed': True, 'approvers': ('Emergency_Team',), 'approval_order': 'sequential', 'escalation_path': ('IT_Director', 'CISO'), 'timeout_hours': 1}
+_EMERGENCY_EMAIL_DRAFT: Dict[str, Any] = {'subject': 'EMERGENCY: Manual Review Required', 'recipients': ('emergency@company.com',), 'cc': ('it.director@company.com',), 'body': 'EMERGENCY: Planning system error - immediate manual review required', 'attachments': (), 'urgency_note': 'IMMEDIATE ATTENTION REQUIRED'}
+_EMERGENCY_RISK_ASSESSMENT: Dict[str, Any] = {'risk_level': 'CRITICAL', 'risks': ('System error', 'Service disruption'), 'mitigation_strategies': ('Immediate manual intervention',), 'rollback_plan': 'Emergency procedures'}
+_EMERGENCY_COMPLIANCE_CHECKLIST: Tuple[str, ...] = ('Emergency_procedures_activated', 'Manual_review_required')
+_EMERGENCY_SUCCESS_CRITERIA: Tuple[str, ...] = ('Emergency resolved', 'Manual review completed')
+
+
+def _plan_section(template: Dict[str, Any]) -> Dict[str, Any]:
+    """A plan's own copy of a fixed section, with its tuples turned into lists"""
+    return {key: list(value) if isinstance(value, tuple) else value for key, value in template.items()}
+
+
+def _draft_plan(state: ITGraphState, llm_response: str,
+                json_parser: JSONResponseParser) -> Tuple[PlanRecord, Optional[Dict[str, Any]]]:
+    """
+    Build the plan record for a planner response.
+    
+    Returns the record and the parsed JSON, or a fallback record and None
+    when the response could not be parsed (the error is added to state).
+    """
+    # Parse JSON response
+    parse_success, json_data, validation_errors = json_parser.parse_response(llm_response)
+    
+    if not parse_success:
+        # Handle parsing/validation errors
+        error_record = {
+            'error_id': f"planning_error_{datetime.now().timestamp()}",
+            'timestamp': datetime.now(),
+            'error_type': 'planning_parsing_error',
+            'message': f"Failed to parse planner response: {validation_errors}",
+            'stack_trace': None,
+            'context': {
+                'node': 'planner',
+                'llm_response': llm_response[:500],  # First 500 chars
+                'validation_errors': validation_errors
+            },
+            'severity': 'high',
+            'resolved': False,
+            'resolution_notes': None
+        }
         
-        return body.strip()
+        if 'errors' not in state:
+            state['errors'] = []
+        state['errors'].append(error_record)
+        
+        # Create fallback plan record
+        fallback_plan = PlanRecord(
+            plan_id=f"fallback_plan_{os.urandom(4).hex().upper()}",
+            request_summary="Fallback plan due to parsing errors",
+            classification=DecisionType.REQUIRES_APPROVAL,
+            priority=PriorityLevel.MEDIUM,
+            estimated_duration=0.0,
+            steps=[],
+            approval_workflow=_plan_section(_FALLBACK_APPROVAL_WORKFLOW),
+            email_draft=_plan_section(_FALLBACK_EMAIL_DRAFT),
+            risk_assessment=_plan_section(_FALLBACK_RISK_ASSESSMENT),
+            compliance_checklist=list(_FALLBACK_COMPLIANCE_CHECKLIST),
+            success_criteria=list(_FALLBACK_SUCCESS_CRITERIA),
+            created_at=datetime.now(),
+            last_updated=datetime.now()
+        )
+        return fallback_plan, None
+    
+    # Create plan record from parsed data
+    plan_record = PlanRecord(
+        plan_id=json_data['plan_id'],
+        request_summary=json_data['request_summary'],
+        classification=_DECISION_MAP[json_data['classification']],
+        priority=_PRIORITY_MAP[json_data['priority']],
+        estimated_duration=float(json_data['estimated_duration']),
+        steps=[_plan_step(step) for step in json_data['steps']],
+        approval_workflow=json_data['approval_workflow'],
+        email_draft=json_data['email_draft'],
+        risk_assessment=json_data['risk_assessment'],
+        compliance_checklist=json_data['compliance_checklist'],
+        success_criteria=json_data['success_criteria'],
+        created_at=datetime.now(),
+        last_updated=datetime.now()
+    )
+    return plan_record, json_data
+
+
+def _mark_waiting_for_approval(state: ITGraphState, reason: str,
+                               custom_fields: Optional[Dict[str, Any]] = None) -> None:
+    """Move the state's ticket to waiting_for_approval, recording any approval fields on it"""
+    if 'ticket_record' in state and state['ticket_record'].get('ticket_id'):
+        ticket_id = state['ticket_record']['ticket_id']
+        try:
+            update_ticket_status(ticket_id, 'waiting_for_approval', reason)
+            
+            if custom_fields:
+                # Add approval metadata to ticket
+                if 'custom_fields' not in state['ticket_record']:
+                    state['ticket_record']['custom_fields'] = {}
+                
+                state['ticket_record']['custom_fields'].update(custom_fields)
+                
+        except Exception as e:
+            logger.error("Failed to update ticket status: %s", e)
+
+
+def _plan_effects(state: ITGraphState, plan_record: PlanRecord, json_data: Optional[Dict[str, Any]],
+                  input_data: PlanningInput, target_model: str,
+                  approval_manager: ApprovalManager) -> List[Callable[[], Any]]:
+    """
+    Attach a plan to state and return the ticket I/O it still requires.
+    
+    The returned calls (ticket status update, approval email) are
+    independent of each other and of persisting the plan.
+    """
+    # Update state with plan record
+    state['plan_record'] = plan_record
+    
+    if json_data is None:
+        # Mark ticket as requires approval
+        return [partial(_mark_waiting_for_approval, state, 'Planning system error - manual review required')]
+    
+    effects = []
+    
+    # Check if approval is required
+    requires_approval = approval_manager.check_approval_required(json_data)
+    
+    if requires_approval:
+        # Create enhanced email draft
+        email_draft = approval_manager.create_email_draft(json_data, input_data.user_request)
+        
+        # Attach email draft to plan record
+        state['plan_record']['email_draft'] = email_draft
+        
+        # Mark ticket as requires approval
+        effects.append(partial(_mark_waiting_for_approval, state, 'Manager approval required', {
+            'requires_approval': True,
+            'approval_workflow': json_data['approval_workflow'],
+            'email_draft': email_draft,
+            'approval_timeout_hours': json_data['approval_workflow'].get('timeout_hours', 24)
+        }))
+        
+        # Send approval email if emailer is configured
+        if 'ticket_record' in state and state['ticket_record'].get('ticket_id'):
+            effects.append(partial(approval_manager.send_approval_email, email_draft, state['ticket_record']['ticket_id']))
+    
+    # Add planning metadata
+    if 'metadata' not in state:
+        state['metadata'] = {}
+    state['metadata']['planning'] = {
+        'plan_id': plan_record['plan_id'],
+        'classification': plan_record['classification'],
+        'priority': plan_record['priority'],
+        'estimated_duration': plan_record['estimated_duration'],
+        'steps_count': len(plan_record['steps']),
+        'requires_approval': requires_approval,
+        'approval_actors': approval_manager.get_approval_actors(json_data) if requires_approval else [],
+        'planning_timestamp': datetime.now().isoformat(),
+        'model_used': target_model
+    }
+    
+    return effects
+
+
+def _finish_plan(state: ITGraphState, plan_record: PlanRecord, json_data: Optional[Dict[str, Any]],
+                 input_data: PlanningInput, target_model: str,
+                 approval_manager: ApprovalManager) -> ITGraphState:
+    """Attach a persisted plan to state and handle approval requirements"""
+    for effect in _plan_effects(state, plan_record, json_data, input_data, target_model, approval_manager):
+        effect()
+    return state
+
+
+def _apply_emergency_plan(state: ITGraphState, e: Exception, plan_repo: PlanRepository) -> ITGraphState:
+    """Record an unexpected planner error and attach the emergency plan"""
+    error_record = {
+        'error_id': f"planning_error_{datetime.now().timestamp()}",
+        'timestamp': datetime.now(),
+        'error_type': 'planning_error',
+        'message': f"Unexpected error in planner node: {str(e)}",
+        'stack_trace': None,
+        'context': {'node': 'planner', 'state_keys': list(state.keys())},
+        'severity': 'critical',
+        'resolved': False,
+        'resolution_notes': None
+    }
+    
+    if 'errors' not in state:
+        state['errors'] = []
+    state['errors'].append(error_record)
+    
+    # Create emergency fallback plan
+    emergency_plan = PlanRecord(
+        plan_id=f"emergency_plan_{os.urandom(4).hex().upper()}",
+        request_summary="Emergency plan due to system error",
+        classification=DecisionType.REQUIRES_APPROVAL,
+        priority=PriorityLevel.CRITICAL,
+        estimated_duration=0.0,
+        steps=[],
+        approval_workflow=_plan_section(_EMERGENCY_APPROVAL_WORKFLOW),
+        email_draft=_plan_section(_EMERGENCY_EMAIL_DRAFT),
+        risk_assessment=_plan_section(_EMERGENCY_RISK_ASSESSMENT),
+        compliance_checklist=list(_EMERGENCY_COMPLIANCE_CHECKLIST),
+        success_criteria=list(_EMERGENCY_SUCCESS_CRITERIA),
+        created_at=datetime.now(),
+        last_updated=datetime.now()
+    )
+    
+    # Persist emergency plan
+    emergency_plan_id = plan_repo.persist_plan(emergency_plan, *_plan_owner(state))
+    emergency_plan['plan_id'] = emergency_plan_id
+    
+    state['plan_record'] = emergency_plan
+    
+    # Mark ticket as critical and requires approval
+    _mark_waiting_for_approval(state, 'EMERGENCY: Planning system error - immediate manual review required')
+    
+    return state
 
 
 def planner_node(state: ITGraphState) -> ITGraphState:
@@ -528,251 +993,127 @@ def planner_node(state: ITGraphState) -> ITGraphState:
     Returns:
         Updated state with plan_record and potential approval requirements
     """
-    print("\n" + "="*80)
-    print("📋 PLANNER NODE: STARTING EXECUTION")
-    print("="*80)
+    plan_repo = PlanRepository()
     
     try:
-        print(f"📋 PLANNER: Starting planner node execution")
-        print(f"📋 PLANNER: State keys: {list(state.keys())}")
-        print(f"📋 PLANNER: Decision record: {state.get('decision_record', {}).get('decision', 'UNKNOWN')}")
-        
-        # Initialize components
-        prompt_caller = PlannerPromptCaller()
-        json_parser = JSONResponseParser()
-        plan_repo = PlanRepository()
-        approval_manager = ApprovalManager()
-        
-        # Prepare planning input
-        input_data = PlanningInput(
-            user_request=state.get('user_request', {}),
-            decision_record=state.get('decision_record', {}),
-            retrieved_docs=state.get('retrieved_docs', []),
-            past_tickets_features=state.get('metadata', {}).get('past_tickets', []),
-            employee=state.get('employee', {})
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("PLANNER: Starting with state keys %s, decision %s",
+                         list(state.keys()), state.get('decision_record', {}).get('decision', 'UNKNOWN'))
+        
+        # Shared, stateless components
+        prompt_caller = _PROMPT_CALLER
+        json_parser = _PARSER
+        approval_manager = _APPROVAL
         
-        # Get target model from router verdict or use default
-        target_model = state.get('router_verdict', {}).get('target_model', 'planner_model_v1')
+        input_data = _planning_input(state)
+        target_model = _target_model(state)
         
         # Call planner LLM
         llm_response = prompt_caller.call_planner(input_data, target_model)
         
-        # Parse JSON response
-        parse_success, json_data, validation_errors = json_parser.parse_response(llm_response)
-        
-        if not parse_success:
-            # Handle parsing/validation errors
-            error_record = {
-                'error_id': f"planning_error_{datetime.now().timestamp()}",
-                'timestamp': datetime.now(),
-                'error_type': 'planning_parsing_error',
-                'message': f"Failed to parse planner response: {validation_errors}",
-                'stack_trace': None,
-                'context': {
-                    'node': 'planner',
-                    'llm_response': llm_response[:500],  # First 500 chars
-                    'validation_errors': validation_errors
-                },
-                'severity': 'high',
-                'resolved': False,
-                'resolution_notes': None
-            }
-            
-            if 'errors' not in state:
-                state['errors'] = []
-            state['errors'].append(error_record)
-            
-            # Create fallback plan record
-            fallback_plan = PlanRecord(
-                plan_id=f"fallback_plan_{uuid.uuid4().hex[:8].upper()}",
-                request_summary="Fallback plan due to parsing errors",
-                classification=DecisionType.REQUIRES_APPROVAL,
-                priority=PriorityLevel.MEDIUM,
-                estimated_duration=0.0,
-                steps=[],
-                approval_workflow={'needed': True, 'approvers': ['IT_Manager'], 'approval_order': 'sequential', 'escalation_path': ['IT_Director'], 'timeout_hours': 24},
-                email_draft={'subject': 'Manual Review Required', 'recipients': [], 'cc': [], 'body': 'Manual review required due to planning system error', 'attachments': [], 'urgency_note': 'Immediate attention required'},
-                risk_assessment={'risk_level': 'HIGH', 'risks': ['Planning system error'], 'mitigation_strategies': ['Manual review'], 'rollback_plan': 'Manual intervention'},
-                compliance_checklist=['Manual_review_required'],
-                success_criteria=['Manual review completed', 'Plan validated'],
-                created_at=datetime.now(),
-                last_updated=datetime.now()
-            )
-            
-            # Persist fallback plan
-            ticket_id = state.get('ticket_record', {}).get('ticket_id')
-            request_id = state.get('user_request', {}).get('request_id')
-            created_by = state.get('employee', {}).get('employee_id', 'system')
-            
-            fallback_plan_id = plan_repo.persist_plan(fallback_plan, ticket_id, request_id, created_by)
-            fallback_plan['plan_id'] = fallback_plan_id
-            
-            state['plan_record'] = fallback_plan
-            
-            # Mark ticket as requires approval
-            if 'ticket_record' in state and state['ticket_record'].get('ticket_id'):
-                ticket_id = state['ticket_record']['ticket_id']
-                try:
-                    update_ticket_status(ticket_id, 'waiting_for_approval', 'Planning system error - manual review required')
-                except Exception as e:
-                    print(f"Failed to update ticket status: {e}")
-            
-            return state
-        
-        # Create plan record from parsed data
-        plan_record = PlanRecord(
-            plan_id=json_data['plan_id'],
-            request_summary=json_data['request_summary'],
-            classification=DecisionType(json_data['classification']),
-            priority=PriorityLevel(json_data['priority']),
-            estimated_duration=float(json_data['estimated_duration']),
-            steps=[
-                PlanStep(
-                    step_id=step['step_id'],
-                    order=step['order'],
-                    description=step['description'],
-                    actor=ActorType(step['actor']),
-                    actor_details=step['actor_details'],
-                    required_tools=step.get('required_tools', []),
-                    preconditions=step.get('preconditions', []),
-                    postconditions=step.get('postconditions', []),
-                    estimated_duration=int(step['estimated_duration']),
-                    data_privacy_notes=step.get('data_privacy_notes', ''),
-                    dependencies=step.get('dependencies', []),
-                    automation_possible=step.get('automation_possible', False),
-                    fallback_actor=step.get('fallback_actor')
-                )
-                for step in json_data['steps']
-            ],
-            approval_workflow=json_data['approval_workflow'],
-            email_draft=json_data['email_draft'],
-            risk_assessment=json_data['risk_assessment'],
-            compliance_checklist=json_data['compliance_checklist'],
-            success_criteria=json_data['success_criteria'],
-            created_at=datetime.now(),
-            last_updated=datetime.now()
-        )
+        plan_record, json_data = _draft_plan(state, llm_response, json_parser)
         
         # Persist plan record
-        ticket_id = state.get('ticket_record', {}).get('ticket_id')
-        request_id = state.get('user_request', {}).get('request_id')
-        created_by = state.get('employee', {}).get('employee_id', 'system')
-        
-        plan_id = plan_repo.persist_plan(plan_record, ticket_id, request_id, created_by)
-        plan_record['plan_id'] = plan_id
-        
-        # Update state with plan record
-        state['plan_record'] = plan_record
+        plan_record['plan_id'] = plan_repo.persist_plan(plan_record, *_plan_owner(state))
         
-        # Check if approval is required
-        requires_approval = approval_manager.check_approval_required(json_data)
-        
-        if requires_approval:
-            # Create enhanced email draft
-            email_draft = approval_manager.create_email_draft(json_data, input_data.user_request)
-            
-            # Attach email draft to plan record
-            state['plan_record']['email_draft'] = email_draft
-            
-            # Mark ticket as requires approval
-            if 'ticket_record' in state and state['ticket_record'].get('ticket_id'):
-                ticket_id = state['ticket_record']['ticket_id']
-                try:
-                    update_ticket_status(ticket_id, 'waiting_for_approval', 'Manager approval required')
-                    
-                    # Add approval metadata to ticket
-                    if 'custom_fields' not in state['ticket_record']:
-                        state['ticket_record']['custom_fields'] = {}
-                    
-                    state['ticket_record']['custom_fields'].update({
-                        'requires_approval': True,
-                        'approval_workflow': json_data['approval_workflow'],
-                        'email_draft': email_draft,
-                        'approval_timeout_hours': json_data['approval_workflow'].get('timeout_hours', 24)
-                    })
-                    
-                except Exception as e:
-                    print(f"Failed to update ticket status: {e}")
-            
-            # Send approval email if emailer is configured
-            try:
-                if 'ticket_record' in state and state['ticket_record'].get('ticket_id'):
-                    approval_manager.send_approval_email(email_draft, state['ticket_record']['ticket_id'])
-            except Exception as e:
-                print(f"Failed to send approval email: {e}")
-        
-        # Add planning metadata
-        if 'metadata' not in state:
-            state['metadata'] = {}
-        state['metadata']['planning'] = {
-            'plan_id': plan_record['plan_id'],
-            'classification': plan_record['classification'],
-            'priority': plan_record['priority'],
-            'estimated_duration': plan_record['estimated_duration'],
-            'steps_count': len(plan_record['steps']),
-            'requires_approval': requires_approval,
-            'approval_actors': approval_manager.get_approval_actors(json_data) if requires_approval else [],
-            'planning_timestamp': datetime.now().isoformat(),
-            'model_used': target_model
-        }
-        
-        return state
+        return _finish_plan(state, plan_record, json_data, input_data, target_model, approval_manager)
         
     except Exception as e:
         # Handle unexpected errors
-        error_record = {
-            'error_id': f"planning_error_{datetime.now().timestamp()}",
-            'timestamp': datetime.now(),
-            'error_type': 'planning_error',
-            'message': f"Unexpected error in planner node: {str(e)}",
-            'stack_trace': None,
-            'context': {'node': 'planner', 'state_keys': list(state.keys())},
-            'severity': 'critical',
-            'resolved': False,
-            'resolution_notes': None
-        }
-        
-        if 'errors' not in state:
-            state['errors'] = []
-        state['errors'].append(error_record)
+        return _apply_emergency_plan(state, e, plan_repo)
+
+
+async def planner_node_async(state: ITGraphState) -> ITGraphState:
+    """
+    Async counterpart of planner_node.
+    
+    Awaits the planner LLM and persists the plan, then updates the ticket
+    and sends the approval email concurrently instead of one after another.
+    Nothing is sent for a plan that failed to persist.
+    """
+    plan_repo = PlanRepository()
+    
+    try:
+        # Shared, stateless components
+        prompt_caller = _PROMPT_CALLER
+        json_parser = _PARSER
+        approval_manager = _APPROVAL
         
-        # Create emergency fallback plan
-        emergency_plan = PlanRecord(
-            plan_id=f"emergency_plan_{uuid.uuid4().hex[:8].upper()}",
-            request_summary="Emergency plan due to system error",
-            classification=DecisionType.REQUIRES_APPROVAL,
-            priority=PriorityLevel.CRITICAL,
-            estimated_duration=0.0,
-            steps=[],
-            approval_workflow={'needed': True, 'approvers': ['Emergency_Team'], 'approval_order': 'sequential', 'escalation_path': ['IT_Director', 'CISO'], 'timeout_hours': 1},
-            email_draft={'subject': 'EMERGENCY: Manual Review Required', 'recipients': ['emergency@company.com'], 'cc': ['it.director@company.com'], 'body': 'EMERGENCY: Planning system error - immediate manual review required', 'attachments': [], 'urgency_note': 'IMMEDIATE ATTENTION REQUIRED'},
-            risk_assessment={'risk_level': 'CRITICAL', 'risks': ['System error', 'Service disruption'], 'mitigation_strategies': ['Immediate manual intervention'], 'rollback_plan': 'Emergency procedures'},
-            compliance_checklist=['Emergency_procedures_activated', 'Manual_review_required'],
-            success_criteria=['Emergency resolved', 'Manual review completed'],
-            created_at=datetime.now(),
-            last_updated=datetime.now()
-        )
+        input_data = _planning_input(state)
+        target_model = _target_model(state)
         
-        # Persist emergency plan
-        ticket_id = state.get('ticket_record', {}).get('ticket_id')
-        request_id = state.get('user_request', {}).get('request_id')
-        created_by = state.get('employee', {}).get('employee_id', 'system')
+        # Call planner LLM
+        llm_response = await prompt_caller.acall_planner(input_data, target_model)
         
-        emergency_plan_id = plan_repo.persist_plan(emergency_plan, ticket_id, request_id, created_by)
-        emergency_plan['plan_id'] = emergency_plan_id
+        plan_record, json_data = _draft_plan(state, llm_response, json_parser)
         
-        state['plan_record'] = emergency_plan
+        # Persist plan record (sync clients run in worker threads)
+        plan_record['plan_id'] = await asyncio.to_thread(plan_repo.persist_plan, plan_record, *_plan_owner(state))
         
-        # Mark ticket as critical and requires approval
-        if 'ticket_record' in state and state['ticket_record'].get('ticket_id'):
-            ticket_id = state['ticket_record']['ticket_id']
-            try:
-                update_ticket_status(ticket_id, 'waiting_for_approval', 'EMERGENCY: Planning system error - immediate manual review required')
-            except Exception as update_error:
-                print(f"Failed to update ticket status: {update_error}")
+        # Ticket update and approval email are independent; run them together
+        effects = _plan_effects(state, plan_record, json_data, input_data, target_model, approval_manager)
+        await asyncio.gather(*(asyncio.to_thread(effect) for effect in effects))
         
         return state
+        
+    except Exception as e:
+        # Handle unexpected errors
+        return await asyncio.to_thread(_apply_emergency_plan, state, e, plan_repo)
+
+
+def plan_many(states: List[ITGraphState]) -> List[ITGraphState]:
+    """
+    Plan several tickets at once.
+    
+    Same result per state as planner_node, but the planner LLM is called
+    with one batched request and the plans are persisted in one transaction.
+    
+    Args:
+        states: Workflow states to plan
+        
+    Returns:
+        The updated states, in the same order
+    """
+    prompt_caller = _PROMPT_CALLER
+    json_parser = _PARSER
+    plan_repo = PlanRepository()
+    approval_manager = _APPROVAL
+    
+    inputs = [_planning_input(state) for state in states]
+    target_models = [_target_model(state) for state in states]
+    
+    try:
+        responses = prompt_caller.call_planner_many(inputs, target_models)
+    except Exception as e:
+        return [_apply_emergency_plan(state, e, plan_repo) for state in states]
+    
+    drafts = []
+    for state, response in zip(states, responses):
+        try:
+            if isinstance(response, Exception):
+                raise response
+            drafts.append(_draft_plan(state, response, json_parser))
+        except Exception as e:
+            _apply_emergency_plan(state, e, plan_repo)
+            drafts.append(None)
+    
+    drafted = [i for i, draft in enumerate(drafts) if draft is not None]
+    try:
+        plan_ids = plan_repo.persist_plans([(drafts[i][0], *_plan_owner(states[i])) for i in drafted])
+    except Exception as e:
+        for i in drafted:
+            _apply_emergency_plan(states[i], e, plan_repo)
+        return states
+    
+    for i, plan_id in zip(drafted, plan_ids):
+        plan_record, json_data = drafts[i]
+        plan_record['plan_id'] = plan_id
+        try:
+            _finish_plan(states[i], plan_record, json_data, inputs[i], target_models[i], approval_manager)
+        except Exception as e:
+            _apply_emergency_plan(states[i], e, plan_repo)
+    
+    return states
 
 
 # Convenience functions for testing and direct usage
@@ -6,11 +6,15 @@ and relevance scoring for IT support requests.
 """
 
 import hashlib
+import math
 import re
+import threading
+import time
 from typing import List, Dict, Any, Tuple, Optional
 from datetime import datetime
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from functools import cached_property
 
 from ..state import (
     ITGraphState, RetrievedDocument, Citation, RetrievedDocumentModel, CitationModel
@@ -26,6 +30,19 @@ class DocumentSection:
     start_pos: int
     end_pos: int
     level: int  # Heading level (1 = main, 2 = sub, etc.)
+    parent_doc_id: Optional[str] = None  # doc_id of the document the section came from
+    
+    # Derived from content on first use (after extract_sections has filled it in)
+    # and shared by relevance scoring and deduplication
+    @cached_property
+    def lower_content(self) -> str:
+        """Lowercased section content"""
+        return self.content.lower()
+    
+    @cached_property
+    def words(self) -> frozenset:
+        """Distinct lowercased whitespace-separated words of the content"""
+        return frozenset(self.lower_content.split())
 
 
 @dataclass
@@ -40,12 +57,45 @@ class RelevanceScore:
 class DocumentRetriever:
     """Handles document retrieval and processing"""
     
+    # Results kept per (normalized query, max_results), least recently used evicted first
+    CACHE_SIZE = 1024
+    CACHE_TTL_SECONDS = 3600
+    
     def __init__(self, knowledge_base_client=None):
         self.kb_client = knowledge_base_client
-        self.cache = {}
-        
-    def retrieve_documents(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
-        """Retrieve documents from knowledge base"""
+        self.cache: "OrderedDict[Tuple[str, int], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+    def retrieve_documents(self, query: str, max_results: int = 10,
+                           use_cache: bool = True) -> List[Dict[str, Any]]:
+        """
+        Retrieve documents from knowledge base
+        
+        Args:
+            query: Search query
+            max_results: Maximum number of documents to return
+            use_cache: Serve a cached result younger than CACHE_TTL_SECONDS; pass
+                False to force a fresh search (the result is still cached)
+        """
+        key = (' '.join(query.lower().split()), max_results)
+        now = time.monotonic()
+        if use_cache:
+            with self._cache_lock:
+                entry = self.cache.get(key)
+                if entry is not None and now - entry[0] < self.CACHE_TTL_SECONDS:
+                    self.cache.move_to_end(key)
+                    return list(entry[1])
+        
+        documents = self._search(query, max_results)
+        with self._cache_lock:
+            self.cache[key] = (now, documents)
+            self.cache.move_to_end(key)
+            if len(self.cache) > self.CACHE_SIZE:
+                self.cache.popitem(last=False)
+        return list(documents)
+    
+    def _search(self, query: str, max_results: int) -> List[Dict[str, Any]]:
+        """Search the knowledge base, bypassing the cache"""
         # Placeholder for actual KB integration
         # In real implementation, this would call the KB client
         if self.kb_client:
@@ -82,6 +132,14 @@ class DocumentRetriever:
         return mock_docs[:max_results]
 
 
+# Markdown header line: leading indentation, 1-6 '#', then the title (offsets
+# are character positions in the document)
+_HEADER_RE = re.compile(r'^[^\S\n]*(#{1,6})[^\S\n]+(\S.*?)[^\S\n]*$', re.MULTILINE)
+
+# Policy vocabulary that makes a section contextually relevant
+_POLICY_TERMS = ('policy', 'procedure', 'guideline', 'rule', 'requirement')
+
+
 class DocumentProcessor:
     """Processes retrieved documents for sections and relevance"""
     
@@ -92,71 +150,63 @@ class DocumentProcessor:
             r'^\d+\.\s+(.+)$',  # Numbered sections
         ]
     
-    def extract_sections(self, content: str, title: str) -> List[DocumentSection]:
-        """Extract logical sections from document content"""
+    def extract_sections(self, content: str, title: str,
+                         doc_id: Optional[str] = None) -> List[DocumentSection]:
+        """Extract logical sections from document content, tagging them with doc_id"""
         sections = []
         
         # Add document title as main section
         sections.append(DocumentSection(
             section_id=f"main_{hashlib.md5(title.encode()).hexdigest()[:8]}",
             title=title,
-            content=content,
+            content=content.strip(),
             start_pos=0,
             end_pos=len(content),
-            level=0
+            level=0,
+            parent_doc_id=doc_id
         ))
         
-        # Extract markdown-style headers
-        lines = content.split('\n')
-        current_section = None
-        
-        for i, line in enumerate(lines):
-            # Check for markdown headers
-            header_match = re.match(r'^(#{1,6})\s+(.+)$', line.strip())
-            if header_match:
-                level = len(header_match.group(1))
-                section_title = header_match.group(2).strip()
-                
-                # Close previous section if exists
-                if current_section:
-                    current_section.end_pos = i
-                    sections.append(current_section)
-                
-                # Start new section
-                section_id = f"section_{hashlib.md5(section_title.encode()).hexdigest()[:8]}"
-                current_section = DocumentSection(
-                    section_id=section_id,
-                    title=section_title,
-                    content="",
-                    start_pos=i + 1,
-                    end_pos=len(lines),
-                    level=level
-                )
-        
-        # Close last section
-        if current_section:
-            current_section.end_pos = len(lines)
-            sections.append(current_section)
-        
-        # Extract content for each section
-        for section in sections:
-            if section.start_pos < len(lines):
-                section.content = '\n'.join(lines[section.start_pos:section.end_pos]).strip()
+        # Extract markdown-style headers; each section runs from the end of its
+        # header line to the start of the next header (or the end of the document)
+        headers = list(_HEADER_RE.finditer(content))
+        for header, next_header in zip(headers, headers[1:] + [None]):
+            section_title = header.group(2)
+            start_pos = header.end()
+            end_pos = next_header.start() if next_header else len(content)
+            
+            sections.append(DocumentSection(
+                section_id=f"section_{hashlib.md5(section_title.encode()).hexdigest()[:8]}",
+                title=section_title,
+                content=content[start_pos:end_pos].strip(),
+                start_pos=start_pos,
+                end_pos=end_pos,
+                level=len(header.group(1)),
+                parent_doc_id=doc_id
+            ))
         
         return sections
     
     def calculate_relevance(self, section: DocumentSection, query: str, 
                            request_context: Dict[str, Any]) -> RelevanceScore:
         """Calculate relevance score for a document section"""
+        return self.score_sections([section], query, request_context)[0]
+    
+    def score_sections(self, sections: List[DocumentSection], query: str,
+                       request_context: Dict[str, Any]) -> List[RelevanceScore]:
+        """Calculate relevance scores for sections, preparing query and context terms once"""
         query_terms = set(query.lower().split())
-        content_terms = set(section.content.lower().split())
-        
+        context_terms = self._context_terms(request_context)
+        return [self._score_section(section, query_terms, context_terms) for section in sections]
+    
+    def _score_section(self, section: DocumentSection, query_terms: set,
+                       context_terms: List[Tuple[str, float]]) -> RelevanceScore:
+        """Relevance score for one section against prepared query and context terms"""
         # Basic term matching
-        matched_terms = query_terms.intersection(content_terms)
+        matched_terms = query_terms.intersection(section.words)
         term_match_score = len(matched_terms) / len(query_terms) if query_terms else 0
         
         # Context relevance
-        context_score = self._calculate_context_relevance(section, request_context)
+        context_score = self._calculate_context_relevance(section, context_terms)
         
         # Section level relevance (main sections get higher scores)
         level_score = 1.0 / (section.level + 1) if section.level > 0 else 1.0
@@ -180,54 +230,100 @@ class DocumentProcessor:
             factors=factors,
             matched_terms=list(matched_terms)
         )
-
+    
+    def _context_terms(self, request_context: Dict[str, Any]) -> List[Tuple[str, float]]:
+        """Lowercased request category, department and priority with their context weights"""
+        # Category, department and priority matches add 0.3, 0.2 and 0.2
+        return [
+            (request_context[key].lower(), weight)
+            for key, weight in (('category', 0.3), ('department', 0.2), ('priority', 0.2))
+            if key in request_context
+        ]
+    
     def _calculate_context_relevance(self, section: DocumentSection, 
-                                   request_context: Dict[str, Any]) -> float:
+                                   context_terms: List[Tuple[str, float]]) -> float:
         """Calculate context-based relevance score"""
-        context_score = 0.0
-        
-        # Check if section content matches request category
-        if 'category' in request_context:
-            category = request_context['category'].lower()
-            if category in section.content.lower():
-                context_score += 0.3
-        
-        # Check if section content matches department
-        if 'department' in request_context:
-            dept = request_context['department'].lower()
-            if dept in section.content.lower():
-                context_score += 0.2
-        
-        # Check if section content matches priority level
-        if 'priority' in request_context:
-            priority = request_context['priority'].lower()
-            if priority in section.content.lower():
-                context_score += 0.2
+        content = section.lower_content
+        
+        # Check if section content matches request category, department or priority
+        context_score = sum(weight for term, weight in context_terms if term in content)
         
         # Check for policy-related terms
-        policy_terms = ['policy', 'procedure', 'guideline', 'rule', 'requirement']
-        policy_matches = sum(1 for term in policy_terms if term in section.content.lower())
-        context_score += (policy_matches / len(policy_terms)) * 0.3
+        policy_matches = sum(1 for term in _POLICY_TERMS if term in content)
+        context_score += (policy_matches / len(_POLICY_TERMS)) * 0.3
         
         return min(context_score, 1.0)
 
 
+class _JaccardIndex:
+    """
+    Index of token sets answering "is any stored set more than threshold-similar?"
+    
+    Uses prefix filtering: with tokens in a fixed order, two sets whose Jaccard
+    similarity is at least t share a token among the first |S| - ceil(t*|S|) + 1
+    tokens of each. Only stored sets sharing such a prefix token (and of
+    compatible size) get an exact Jaccard check, instead of every stored set.
+    """
+    
+    def __init__(self, threshold: float):
+        self.threshold = threshold
+        self._sets: List[frozenset] = []
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+    
+    def _prefix(self, tokens: frozenset) -> List[str]:
+        """Prefix tokens of a set; the epsilon keeps float error from shortening it"""
+        ordered = sorted(tokens)
+        return ordered[:len(ordered) - math.ceil(self.threshold * len(ordered) - 1e-9) + 1]
+    
+    def has_similar(self, tokens: frozenset) -> bool:
+        """Whether a stored set has Jaccard similarity above the threshold"""
+        size = len(tokens)
+        checked = set()
+        for token in self._prefix(tokens):
+            for idx in self._postings.get(token, ()):
+                if idx in checked:
+                    continue
+                checked.add(idx)
+                other = self._sets[idx]
+                # |A & B| / |A | B| <= min/max size, so skip sets of incompatible size
+                if min(size, len(other)) <= self.threshold * max(size, len(other)):
+                    continue
+                if len(tokens & other) / len(tokens | other) > self.threshold:
+                    return True
+        return False
+    
+    def add(self, tokens: frozenset) -> None:
+        """Store a token set"""
+        idx = len(self._sets)
+        self._sets.append(tokens)
+        for token in self._prefix(tokens):
+            self._postings[token].append(idx)
+
+
 class DeduplicationEngine:
     """Handles document and content deduplication"""
     
     def __init__(self):
-        self.content_hashes = set()
         self.similarity_threshold = 0.8
     
-    def deduplicate_documents(self, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Remove duplicate documents based on content similarity"""
+    def deduplicate_documents(self, documents: List[Dict[str, Any]],
+                              seen: Optional[set] = None) -> List[Dict[str, Any]]:
+        """
+        Remove duplicate documents based on content similarity
+        
+        Args:
+            documents: Documents to deduplicate
+            seen: Content hashes already taken (updated in place); a fresh set if omitted
+        """
+        if seen is None:
+            seen = set()
         unique_docs = []
         
         for doc in documents:
             content_hash = self._generate_content_hash(doc['content'])
             
-            if content_hash not in self.content_hashes:
-                self.content_hashes.add(content_hash)
+            if content_hash not in seen:
+                seen.add(content_hash)
                 unique_docs.append(doc)
         
         return unique_docs
@@ -235,37 +331,20 @@ class DeduplicationEngine:
     def deduplicate_sections(self, sections: List[DocumentSection]) -> List[DocumentSection]:
         """Remove duplicate sections based on content similarity"""
         unique_sections = []
+        index = _JaccardIndex(self.similarity_threshold)
         
         for section in sections:
-            if not self._is_duplicate_section(section, unique_sections):
+            if not index.has_similar(section.words):
+                index.add(section.words)
                 unique_sections.append(section)
         
         return unique_sections
     
     def _generate_content_hash(self, content: str) -> str:
         """Generate hash for content deduplication"""
-        # Normalize content for better deduplication
-        normalized = re.sub(r'\s+', ' ', content.strip().lower())
-        return hashlib.md5(normalized.encode()).hexdigest()
-    
-    def _is_duplicate_section(self, section: DocumentSection, 
-                            existing_sections: List[DocumentSection]) -> bool:
-        """Check if section is duplicate of existing sections"""
-        for existing in existing_sections:
-            similarity = self._calculate_similarity(section.content, existing.content)
-            if similarity > self.similarity_threshold:
-                return True
-        return False
-    
-    def _calculate_similarity(self, content1: str, content2: str) -> float:
-        """Calculate content similarity using Jaccard similarity"""
-        words1 = set(content1.lower().split())
-        words2 = set(content2.lower().split())
-        
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-        
-        return len(intersection) / len(union) if union else 0.0
+        # Normalize content for better deduplication: case-fold and collapse whitespace runs
+        normalized = ' '.join(content.lower().split())
+        return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
 
 
 class CitationGenerator:
@@ -321,6 +400,13 @@ class CitationGenerator:
         )
 
 
+# Shared by every retrieve_node call, so the retriever's cache outlives a request
+_RETRIEVER = DocumentRetriever()
+_PROCESSOR = DocumentProcessor()
+_DEDUPLICATOR = DeduplicationEngine()
+_CITATION_GEN = CitationGenerator()
+
+
 def retrieve_node(state: ITGraphState) -> ITGraphState:
     """
     Retrieve node: fills retrieved_docs and citations based on user request
@@ -344,32 +430,35 @@ def retrieve_node(state: ITGraphState) -> ITGraphState:
         query = f"{user_request.get('title', '')} {user_request.get('description', '')}"
         print(f"📚 RETRIEVE: Query: {query}")
         
-        # Initialize components
-        retriever = DocumentRetriever()
-        processor = DocumentProcessor()
-        deduplicator = DeduplicationEngine()
-        citation_gen = CitationGenerator()
+        # Shared components; per-request dedup state stays local
+        retriever = _RETRIEVER
+        processor = _PROCESSOR
+        deduplicator = _DEDUPLICATOR
+        citation_gen = _CITATION_GEN
         
         # Retrieve documents
         raw_documents = retriever.retrieve_documents(query, max_results=15)
         
         # Deduplicate documents
-        unique_documents = deduplicator.deduplicate_documents(raw_documents)
+        unique_documents = deduplicator.deduplicate_documents(raw_documents, seen=set())
         
         # Process documents and extract sections
         all_sections = []
         for doc in unique_documents:
-            sections = processor.extract_sections(doc['content'], doc['title'])
+            sections = processor.extract_sections(doc['content'], doc['title'], doc['doc_id'])
             all_sections.extend(sections)
         
         # Deduplicate sections
         unique_sections = deduplicator.deduplicate_sections(all_sections)
         
         # Calculate relevance scores
-        relevance_scores = []
-        for section in unique_sections:
-            score = processor.calculate_relevance(section, query, user_request)
-            relevance_scores.append(score)
+        relevance_scores = processor.score_sections(unique_sections, query, user_request)
+        
+        # Best section score per source document
+        best_score_by_doc: Dict[str, float] = {}
+        for section, score in zip(unique_sections, relevance_scores):
+            if score.score > best_score_by_doc.get(section.parent_doc_id, float('-inf')):
+                best_score_by_doc[section.parent_doc_id] = score.score
         
         # Generate citations
         citations = citation_gen.generate_citations(unique_sections, relevance_scores)
@@ -377,10 +466,7 @@ def retrieve_node(state: ITGraphState) -> ITGraphState:
         # Convert to RetrievedDocument format
         retrieved_docs = []
         for doc in unique_documents:
-            # Safely calculate relevance score
-            doc_scores = [score.score for score in relevance_scores 
-                         if score.section_id.startswith(doc['doc_id'])]
-            relevance_score = max(doc_scores) if doc_scores else 0.5  # Default score if no sections
+            relevance_score = best_score_by_doc.get(doc['doc_id'], 0.5)  # Default score if no sections
             
             retrieved_doc = RetrievedDocument(
                 doc_id=doc['doc_id'],
@@ -5,12 +5,21 @@ This module defines the state structure for the IT support workflow graph,
 including both TypedDict and Pydantic models for flexible state handling.
 """
 
+import json
 from typing import List, Optional, Dict, Any, Union
 from typing_extensions import TypedDict
 from pydantic import BaseModel, Field
 from datetime import datetime
 from enum import Enum
 
+# orjson is optional; fall back to the stdlib encoder when it is not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 
 # Enums for state values
 class RequestStatus(str, Enum):
@@ -444,3 +453,30 @@ def get_state_summary(state: ITGraphState) -> Dict[str, Any]:
         "error_count": len(state.get("errors", [])),
         "last_updated": state.get("ticket_record", {}).get("updated_at")
     }
+
+
+def serialize_state(state: Any, sort_keys: bool = False) -> bytes:
+    """
+    Serialize workflow state (or any fragment of it) to JSON bytes.
+    
+    Uses orjson when available, which natively handles datetimes, enums and
+    dataclasses such as the IT agent's ``UserGuide``. Falls back to the
+    stdlib encoder otherwise. Pass ``sort_keys`` when the bytes are hashed
+    or compared, so equal dicts serialize identically.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NAIVE_UTC
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(state, option=option, default=str)
+    return json.dumps(state, default=_json_default, sort_keys=sort_keys).encode("utf-8")
+
+
+def _json_default(value: Any) -> Any:
+    """Fallback encoder for values the stdlib json module can't handle"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if hasattr(value, "__dataclass_fields__"):
+        from dataclasses import asdict
+        return asdict(value)
+    return str(value)
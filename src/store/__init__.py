@@ -7,6 +7,7 @@ from .db import (
     ToolCall,
     save_decision,
     save_plan,
+    save_plans,
     save_ticket,
     update_ticket_status,
     list_tickets,
@@ -31,6 +32,7 @@ __all__ = [
     "ToolCall",
     "save_decision",
     "save_plan",
+    "save_plans",
     "save_ticket",
     "update_ticket_status",
     "list_tickets",
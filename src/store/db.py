@@ -2,7 +2,7 @@
 
 import uuid
 from datetime import datetime
-from typing import List, Optional, Union, Dict, Any
+from typing import List, Optional, Tuple, Union, Dict, Any
 from contextlib import contextmanager
 
 from sqlmodel import Field, Session, SQLModel, create_engine, select
@@ -138,11 +138,21 @@ def save_plan(plan: Plan) -> Plan:
         return plan
 
 
-def save_plan_from_record(plan_record: Dict[str, Any], ticket_id: str, request_id: str, created_by: str) -> Plan:
-    """Save a plan from PlanRecord dictionary to the database."""
+def save_plans(plans: List[Plan]) -> List[Plan]:
+    """Save several plans to the database in a single transaction."""
+    with get_db_session() as session:
+        session.add_all(plans)
+        session.commit()
+        for plan in plans:
+            session.refresh(plan)
+        return plans
+
+
+def _plan_from_record(plan_record: Dict[str, Any], ticket_id: str, request_id: str, created_by: str) -> Plan:
+    """Build a Plan row from a PlanRecord dictionary."""
     import json
     
-    plan = Plan(
+    return Plan(
         plan_id=plan_record.get('plan_id', f"plan_{uuid.uuid4().hex[:8].upper()}"),
         ticket_id=ticket_id,
         request_id=request_id,
@@ -160,8 +170,16 @@ def save_plan_from_record(plan_record: Dict[str, Any], ticket_id: str, request_i
         success_criteria=json.dumps(plan_record.get('success_criteria', [])),
         created_by=created_by
     )
-    
-    return save_plan(plan)
+
+
+def save_plan_from_record(plan_record: Dict[str, Any], ticket_id: str, request_id: str, created_by: str) -> Plan:
+    """Save a plan from PlanRecord dictionary to the database."""
+    return save_plan(_plan_from_record(plan_record, ticket_id, request_id, created_by))
+
+
+def save_plans_from_records(entries: List[Tuple[Dict[str, Any], str, str, str]]) -> List[Plan]:
+    """Save (plan_record, ticket_id, request_id, created_by) entries in a single transaction."""
+    return save_plans([_plan_from_record(*entry) for entry in entries])
 
 
 def save_ticket(ticket: Ticket) -> Ticket:
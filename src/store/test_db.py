@@ -11,6 +11,7 @@ from .db import (
     save_ticket,
     save_decision,
     save_plan,
+    save_plans_from_records,
     update_ticket_status,
     list_tickets,
     get_ticket,
@@ -216,6 +217,31 @@ def test_get_ticket_statistics(setup_db):
     assert "software" in stats["category_breakdown"]
 
 
+def test_save_plans_from_records(setup_db):
+    """Test saving several plan records in one transaction."""
+    records = [
+        {
+            'plan_id': f"PLAN_{n}",
+            'request_summary': f"Request {n}",
+            'classification': 'ALLOWED',
+            'priority': 'low',
+            'estimated_duration': 2.0,
+            'steps': [{'step_id': 'step_1', 'description': f"Step for {n}"}],
+        }
+        for n in range(3)
+    ]
+    entries = [(record, f"ticket_{n}", f"request_{n}", "ai_system") for n, record in enumerate(records)]
+    
+    saved_plans = save_plans_from_records(entries)
+    
+    assert [plan.plan_id for plan in saved_plans] == ["PLAN_0", "PLAN_1", "PLAN_2"]
+    assert [plan.ticket_id for plan in saved_plans] == ["ticket_0", "ticket_1", "ticket_2"]
+    assert all(plan.id is not None for plan in saved_plans)
+    assert saved_plans[1].request_summary == "Request 1"
+    assert saved_plans[1].steps == '[{"step_id": "step_1", "description": "Step for 1"}]'
+    assert saved_plans[2].approval_workflow == '{}'
+
+
 if __name__ == "__main__":
     # Run tests
     pytest.main([__file__])
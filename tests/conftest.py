@@ -0,0 +1,71 @@
+"""Shared fixtures for the test suite."""
+
+import itertools
+import threading
+import time
+
+import pytest
+
+
+class FakeJiraClient:
+    """In-memory stand-in for JiraClient that records every call instead of calling Jira"""
+
+    def __init__(self, config=None, failing_transitions=()):
+        self.config = {'base_url': 'https://example.atlassian.net', 'use_mock': False, **(config or {})}
+        self.failing_transitions = set(failing_transitions)
+        self.calls = []
+        self._keys = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def _record(self, *call):
+        with self._lock:
+            self.calls.append(call)
+
+    def _next_key(self):
+        with self._lock:
+            return f"IT-{next(self._keys)}"
+
+    def create_ticket(self, ticket_data):
+        key = self._next_key()
+        self._record('create_ticket', key, ticket_data.summary)
+        return key
+
+    def create_tickets_bulk(self, ticket_datas):
+        keys = [self._next_key() for _ in ticket_datas]
+        self._record('create_tickets_bulk', tuple(keys))
+        return keys
+
+    def transition_ticket(self, transition_data):
+        self._record('transition_ticket', transition_data.ticket_id, transition_data.transition_name)
+        return transition_data.ticket_id not in self.failing_transitions
+
+    def add_comment(self, ticket_id, comment):
+        self._record('add_comment', ticket_id, comment)
+        return True
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_jira_client():
+    """A FakeJiraClient with no failing transitions"""
+    return FakeJiraClient()
+
+
+class FakeClock:
+    """Controllable replacement for time.monotonic"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Patch time.monotonic for every module that reads it through ``time``"""
+    fake_clock = FakeClock()
+    monkeypatch.setattr(time, 'monotonic', fake_clock)
+    return fake_clock
@@ -0,0 +1,81 @@
+"""Tests for the Jira agent node."""
+
+import pytest
+
+from src.graph.nodes import jira_agent
+from src.graph.nodes.jira_agent import JiraWorkflowManager, TicketRecordPersister, jira_agent_node
+
+
+@pytest.fixture
+def workflow_manager(monkeypatch, fake_jira_client):
+    """Route the node through a workflow manager backed by the fake Jira client"""
+    manager = JiraWorkflowManager(fake_jira_client, TicketRecordPersister())
+    monkeypatch.setattr(jira_agent, '_get_workflow_manager', lambda: manager)
+    return manager
+
+
+def _software_request_state():
+    return {
+        'user_request': {
+            'title': 'Software Installation Request',
+            'description': 'Need Visual Studio Code installed on development machine',
+            'category': 'software',
+            'priority': 'MEDIUM',
+            'department': 'engineering',
+            'urgency': 'normal',
+            'requested_by': 'dev_user_001'
+        },
+        'decision_record': {
+            'decision': 'ALLOWED',
+            'confidence': 0.92,
+            'needs_human': False,
+            'justification_brief': 'Standard software installation request meets policy requirements',
+            'citations': [
+                {
+                    'source': 'Software_Installation_Policy',
+                    'text': 'Standard development tools may be installed upon request',
+                    'relevance': 'Directly applicable policy for development software'
+                }
+            ],
+            'missing_fields': [],
+            'risk_assessment': {'risk_level': 'LOW', 'reason': 'Standard development tool'}
+        }
+    }
+
+
+def test_jira_agent_node(workflow_manager, fake_jira_client):
+    """An allowed request gets a ticket that is moved straight to In Progress"""
+    result_state = jira_agent_node(_software_request_state())
+
+    ticket_record = result_state['ticket_record']
+    assert ticket_record['ticket_id'] == 'IT-1'
+    assert ticket_record['status'] == 'In Progress'
+    assert ticket_record['category'] == 'software'
+    assert ticket_record['tags'] == ['software', 'automated']
+    assert workflow_manager.ticket_persister.get_ticket('IT-1') is ticket_record
+
+    jira_metadata = result_state['metadata']['jira']
+    assert jira_metadata['ticket_created'] is True
+    assert jira_metadata['ticket_id'] == 'IT-1'
+    assert jira_metadata['status'] == 'In Progress'
+    assert jira_metadata['workflow_stage'] == 'classified'
+    assert jira_metadata['config_loaded'] is True
+    assert jira_metadata['use_mock'] is False
+
+    assert [call[0] for call in fake_jira_client.calls] == ['create_ticket', 'transition_ticket', 'add_comment']
+    assert 'errors' not in result_state
+
+
+def test_jira_agent_node_records_jira_errors(monkeypatch):
+    """Jira failures are recorded on the state instead of raised"""
+    def unconfigured():
+        raise jira_agent.JiraAgentError("JIRA CREDENTIALS REQUIRED")
+    monkeypatch.setattr(jira_agent, '_get_workflow_manager', unconfigured)
+
+    result_state = jira_agent_node(_software_request_state())
+
+    assert 'ticket_record' not in result_state
+    assert len(result_state['errors']) == 1
+    error_record = result_state['errors'][0]
+    assert error_record['error_type'] == 'jira_error'
+    assert 'JIRA CREDENTIALS REQUIRED' in error_record['message']
@@ -0,0 +1,430 @@
+"""Tests for the Jira API clients."""
+
+import json
+
+import pytest
+import requests
+
+from src.graph.nodes import jira_agent
+from src.graph.nodes.jira_agent import (
+    AsyncJiraClient, CircuitOpen, JiraClient, JiraTicketData, JiraTransitionData,
+    _CircuitBreaker, _RateLimitTracker
+)
+
+
+JIRA_CONFIG = {
+    'base_url': 'https://example.atlassian.net',
+    'user': 'bot@example.com',
+    'token': 'secret',
+    'project_key': 'IT',
+}
+
+
+class FakeResponse:
+    """Minimal stand-in for a requests response"""
+
+    def __init__(self, body=None, status_code=200):
+        self.content = json.dumps(body or {}).encode()
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.headers = {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}", response=self)
+
+
+class FakeSession:
+    """Stand-in for the pooled requests session, answering calls from a queue of bodies (or responses)"""
+
+    def __init__(self, *bodies):
+        self.bodies = list(bodies)
+        self.requests = []
+
+    def _respond(self, method, url, data):
+        self.requests.append((method, url, json.loads(data) if data else None))
+        body = self.bodies.pop(0)
+        return body if isinstance(body, FakeResponse) else FakeResponse(body)
+
+    def get(self, url, timeout=None):
+        return self._respond('GET', url, None)
+
+    def post(self, url, data=None, timeout=None):
+        return self._respond('POST', url, data)
+
+    @property
+    def posts(self):
+        return [(url, payload) for method, url, payload in self.requests if method == 'POST']
+
+
+def _ticket_data(summary):
+    return JiraTicketData(summary=summary, description='', issue_type='Task', priority='Medium',
+                          assignee=None, components=[], labels=[], custom_fields={})
+
+
+def _issue(key):
+    return {'id': key.split('-')[1], 'key': key, 'fields': {
+        'summary': f"Summary {key}", 'description': None, 'status': {'name': 'New'},
+        'priority': {'name': 'Medium'}, 'assignee': None, 'components': [], 'labels': [],
+        'created': '2024-01-01T00:00:00', 'updated': '2024-01-01T00:00:00',
+    }}
+
+
+def _client_with_session(session):
+    client = JiraClient(JIRA_CONFIG)
+    client._session = session
+    return client
+
+
+class FakeAsyncResponse:
+    """Minimal stand-in for an aiohttp response context manager"""
+
+    def __init__(self, body=None, status=200):
+        self.body = json.dumps(body or {}).encode()
+        self.status = status
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, tb):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+
+    async def read(self):
+        return self.body
+
+
+class FakeAsyncSession:
+    """Records requests and answers GET /transitions from the ticket's current status"""
+
+    closed = False
+
+    def __init__(self, transitions_by_status, status='Open'):
+        self.transitions_by_status = transitions_by_status
+        self.status = status
+        self.requests = []
+
+    def get(self, url):
+        self.requests.append(('GET', url))
+        transitions = self.transitions_by_status[self.status]
+        return FakeAsyncResponse({'transitions': [{'id': tid, 'name': name} for name, tid in transitions.items()]})
+
+    def post(self, url, data=None):
+        self.requests.append(('POST', url))
+        transition_id = json.loads(data)['transition']['id']
+        self.status = {tid: name for name, tid in self.transitions_by_status[self.status].items()}[transition_id]
+        return FakeAsyncResponse()
+
+
+@pytest.mark.asyncio
+async def test_async_transitions_in_a_row_on_one_ticket():
+    """A second transition sees the ticket's new transitions instead of a stale cache entry"""
+    client = AsyncJiraClient(JIRA_CONFIG)
+    client._session = FakeAsyncSession({
+        'Open': {'In Progress': '11'},
+        'In Progress': {'Close': '21'},
+    })
+
+    assert await client.transition_ticket(JiraTransitionData('IT-1', 'In Progress', '', None, None))
+    assert await client.transition_ticket(JiraTransitionData('IT-1', 'Close', '', None, None))
+
+    assert client._session.status == 'Close'
+    assert [method for method, _ in client._session.requests] == ['GET', 'POST', 'GET', 'POST']
+
+
+@pytest.mark.asyncio
+async def test_async_transition_refetches_on_cache_miss():
+    """A cached entry that doesn't offer the transition is refetched before failing"""
+    client = AsyncJiraClient(JIRA_CONFIG)
+    client._session = FakeAsyncSession({'Open': {'Close': '21'}, 'Close': {}})
+    client._transitions_cache['IT-1'] = {'transitions': []}
+
+    assert await client.transition_ticket(JiraTransitionData('IT-1', 'Close', '', None, None))
+
+    with pytest.raises(jira_agent.JiraAgentError, match="not available"):
+        await client.transition_ticket(JiraTransitionData('IT-1', 'Close', '', None, None))
+
+
+def _session_retry(client):
+    return client._session.get_adapter(JIRA_CONFIG['base_url']).max_retries
+
+
+def test_retry_policy_only_retries_post_when_rate_limited():
+    retry = _session_retry(JiraClient(JIRA_CONFIG))
+
+    assert retry.is_retry('POST', 429)
+    assert not retry.is_retry('POST', 502)
+    assert not retry.is_retry('POST', 503, has_retry_after=True)
+    for method in ('GET', 'PUT', 'DELETE'):
+        assert retry.is_retry(method, 502)
+        assert retry.is_retry(method, 429)
+
+
+def test_retry_policy_survives_increment():
+    retry = _session_retry(JiraClient(JIRA_CONFIG)).increment(method='GET', url='/rest/api/3/issue/IT-1')
+
+    assert type(retry) is jira_agent._JiraRetry
+    assert retry.is_retry('POST', 429) and not retry.is_retry('POST', 504)
+    assert not retry._is_method_retryable('POST')
+
+
+def test_create_tickets_bulk_maps_failed_elements_to_none(monkeypatch):
+    monkeypatch.setattr(JiraClient, 'BULK_CREATE_LIMIT', 2)
+    session = FakeSession(
+        {'issues': [{'key': 'IT-2'}], 'errors': [{'failedElementNumber': 0, 'elementErrors': {}}]},
+        {'issues': [{'key': 'IT-3'}], 'errors': []},
+    )
+    client = _client_with_session(session)
+
+    ticket_ids = client.create_tickets_bulk([_ticket_data('a'), _ticket_data('b'), _ticket_data('c')])
+
+    assert ticket_ids == [None, 'IT-2', 'IT-3']
+    assert [len(payload['issueUpdates']) for _, payload in session.posts] == [2, 1]
+    assert [update['fields']['summary'] for _, payload in session.posts for update in payload['issueUpdates']] == ['a', 'b', 'c']
+
+
+def test_create_tickets_bulk_keeps_order_around_middle_failure():
+    session = FakeSession({'issues': [{'key': 'IT-1'}, {'key': 'IT-3'}],
+                           'errors': [{'failedElementNumber': 1, 'elementErrors': {}}]})
+
+    ticket_ids = _client_with_session(session).create_tickets_bulk([_ticket_data(s) for s in 'abc'])
+
+    assert ticket_ids == ['IT-1', None, 'IT-3']
+
+
+def test_get_tickets_batches_jql():
+    session = FakeSession({'issues': [_issue('IT-1'), _issue('IT-2')]}, {'issues': [_issue('IT-3')]})
+
+    tickets = _client_with_session(session).get_tickets(['IT-1', 'IT-2', 'IT-3'], batch_size=2)
+
+    assert list(tickets) == ['IT-1', 'IT-2', 'IT-3']
+    assert tickets['IT-2']['summary'] == 'Summary IT-2' and tickets['IT-2']['status'] == 'New'
+    assert {url.rsplit('/rest/api/3', 1)[1] for url, _ in session.posts} == {'/search/jql'}
+    assert [payload['jql'] for _, payload in session.posts] == ['key in (IT-1,IT-2)', 'key in (IT-3)']
+
+
+def test_get_tickets_looks_up_keys_singly_when_a_batch_has_a_missing_key():
+    # Jira answers 400 for the whole query when any key in it does not exist
+    session = FakeSession(
+        FakeResponse({'errorMessages': ["An issue with key 'IT-9' does not exist"]}, status_code=400),
+        {'issues': [_issue('IT-1')]},
+        FakeResponse({'errorMessages': ["An issue with key 'IT-9' does not exist"]}, status_code=400),
+        {'issues': [_issue('IT-2')]},
+    )
+
+    tickets = _client_with_session(session).get_tickets(['IT-1', 'IT-9', 'IT-2'])
+
+    assert list(tickets) == ['IT-1', 'IT-2']
+    assert [payload['jql'] for _, payload in session.posts] == [
+        'key in (IT-1,IT-9,IT-2)', 'key in (IT-1)', 'key in (IT-9)', 'key in (IT-2)'
+    ]
+
+
+def test_get_tickets_follows_next_page_token():
+    session = FakeSession({'issues': [_issue('IT-1')], 'nextPageToken': 'page-2'}, {'issues': [_issue('IT-2')]})
+
+    tickets = _client_with_session(session).get_tickets(['IT-1', 'IT-2'])
+
+    assert list(tickets) == ['IT-1', 'IT-2']
+    assert [payload.get('nextPageToken') for _, payload in session.posts] == [None, 'page-2']
+
+
+def test_bulk_calls_raise_jira_agent_error_on_http_failure():
+    class FailingSession(FakeSession):
+        def post(self, url, data=None, timeout=None):
+            return FakeResponse(status_code=500)
+    client = _client_with_session(FailingSession())
+
+    with pytest.raises(jira_agent.JiraAgentError, match="bulk create"):
+        client.create_tickets_bulk([_ticket_data('a')])
+    with pytest.raises(jira_agent.JiraAgentError, match="get JIRA tickets"):
+        client.get_tickets(['IT-1'])
+
+
+def test_circuit_breaker_opens_after_threshold_failures(clock):
+    breaker = _CircuitBreaker(failure_threshold=3, reset_timeout=30.0)
+
+    for _ in range(2):
+        breaker.record_failure()
+        breaker.check()
+    breaker.record_failure()
+
+    with pytest.raises(CircuitOpen):
+        breaker.check()
+
+
+def test_circuit_breaker_half_opens_after_cooldown(clock):
+    breaker = _CircuitBreaker(failure_threshold=2, reset_timeout=30.0)
+    breaker.record_failure()
+    breaker.record_failure()
+
+    clock.now += 29.9
+    with pytest.raises(CircuitOpen):
+        breaker.check()
+
+    # Half-open: one trial call is let through, and a failure reopens at once
+    clock.now += 0.1
+    breaker.check()
+    breaker.record_failure()
+    with pytest.raises(CircuitOpen):
+        breaker.check()
+
+
+def test_circuit_breaker_closes_on_success(clock):
+    breaker = _CircuitBreaker(failure_threshold=2, reset_timeout=30.0)
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now += 30.0
+
+    breaker.check()
+    breaker.record_success()
+    breaker.record_failure()
+
+    breaker.check()
+    assert breaker.failures == 1
+
+
+def test_circuit_breaker_lets_one_trial_through_when_half_open(clock):
+    breaker = _CircuitBreaker(failure_threshold=2, reset_timeout=30.0)
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now += 30.0
+
+    breaker.check()
+    # Other callers stay short-circuited while the trial is in flight
+    with pytest.raises(CircuitOpen):
+        breaker.check()
+
+    breaker.record_success()
+    breaker.check()
+
+
+def _failing_create(client, status_code=None, error=None):
+    def post(url, data=None, timeout=None):
+        if error is not None:
+            raise error
+        return FakeResponse(status_code=status_code)
+    client._session.post = post
+    with pytest.raises(jira_agent.JiraAgentError):
+        client.create_ticket(_ticket_data('a'))
+
+
+@pytest.mark.parametrize('status_code', [400, 401, 403, 404])
+def test_create_ticket_client_errors_do_not_trip_breaker(clock, status_code):
+    client = _client_with_session(FakeSession())
+    client._circuit_breaker = _CircuitBreaker(failure_threshold=2)
+
+    for _ in range(3):
+        _failing_create(client, status_code=status_code)
+
+    assert client._circuit_breaker.failures == 0
+    client._circuit_breaker.check()
+
+
+@pytest.mark.parametrize('error', [None, requests.Timeout("timed out"), requests.ConnectionError("refused")])
+def test_create_ticket_server_failures_trip_breaker(clock, error):
+    client = _client_with_session(FakeSession())
+    client._circuit_breaker = _CircuitBreaker(failure_threshold=2)
+
+    _failing_create(client, status_code=503, error=error)
+    _failing_create(client, status_code=503, error=error)
+
+    with pytest.raises(CircuitOpen):
+        client.create_ticket(_ticket_data('a'))
+
+
+def _transitions(**ids):
+    return {'transitions': [{'id': tid, 'name': name.replace('_', ' ')} for name, tid in ids.items()]}
+
+
+def _transition(client, ticket_id, name):
+    return client.transition_ticket(JiraTransitionData(ticket_id, name, '', None, None))
+
+
+def test_transitions_cache_is_shared_per_project(clock):
+    session = FakeSession(_transitions(Start_Progress='11', Close='21'), None, None)
+    client = _client_with_session(session)
+
+    assert _transition(client, 'IT-1', 'Start Progress')
+    assert _transition(client, 'IT-2', 'Close')
+
+    assert [(method, url.rsplit('/rest/api/3', 1)[1]) for method, url, _ in session.requests] == [
+        ('GET', '/issue/IT-1/transitions'),
+        ('POST', '/issue/IT-1/transitions'),
+        ('POST', '/issue/IT-2/transitions'),
+    ]
+
+
+def test_transitions_cache_refetches_on_miss(clock):
+    session = FakeSession(_transitions(Start_Progress='11'), None, _transitions(Resolve='31'), None)
+    client = _client_with_session(session)
+
+    assert _transition(client, 'IT-1', 'Start Progress')
+    assert _transition(client, 'IT-1', 'Resolve')
+
+    assert [method for method, _, _ in session.requests] == ['GET', 'POST', 'GET', 'POST']
+    assert session.requests[-1][2]['transition']['id'] == '31'
+    # The refetch merges into the fresh mapping rather than replacing it
+    assert client._transitions_cache['IT'][0] == {'Start Progress': '11', 'Resolve': '31'}
+
+
+def test_transitions_cache_refetches_after_ttl(clock):
+    session = FakeSession(_transitions(Close='21'), None, _transitions(Close='22'), None)
+    client = _client_with_session(session)
+
+    assert _transition(client, 'IT-1', 'Close')
+    clock.now += JiraClient.TRANSITIONS_CACHE_TTL
+    assert _transition(client, 'IT-1', 'Close')
+
+    assert [method for method, _, _ in session.requests] == ['GET', 'POST', 'GET', 'POST']
+    assert session.requests[-1][2]['transition']['id'] == '22'
+
+
+def test_transitions_cache_invalidated_on_rejected_transition(clock):
+    class RejectingSession(FakeSession):
+        def post(self, url, data=None, timeout=None):
+            super().post(url, data, timeout)
+            return FakeResponse(status_code=400)
+    client = _client_with_session(RejectingSession(_transitions(Close='21'), None))
+
+    with pytest.raises(jira_agent.JiraAgentError):
+        _transition(client, 'IT-1', 'Close')
+    assert 'IT' not in client._transitions_cache
+
+
+class _HeadersOnly:
+    """A response carrying nothing but headers"""
+
+    def __init__(self, headers):
+        self.headers = headers
+
+
+def test_rate_limit_tracker_sleeps_when_bucket_is_nearly_empty(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(jira_agent.time, 'sleep', sleeps.append)
+    tracker = _RateLimitTracker()
+
+    tracker.update(_HeadersOnly({'X-RateLimit-Remaining': '5'}))
+    tracker.throttle()
+    assert sleeps == []
+
+    tracker.update(_HeadersOnly({'X-RateLimit-Remaining': '1', 'X-RateLimit-FillRate': '4',
+                                 'X-RateLimit-Interval-Seconds': '2'}))
+    tracker.throttle()
+    tracker.throttle()
+    assert sleeps == [0.5]
+
+
+def test_rate_limit_tracker_ignores_malformed_headers(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(jira_agent.time, 'sleep', sleeps.append)
+    tracker = _RateLimitTracker()
+
+    response = _HeadersOnly({'X-RateLimit-Remaining': 'lots'})
+    assert tracker.update(response) is response
+    tracker.throttle()
+
+    assert tracker.remaining is None and sleeps == []
@@ -0,0 +1,238 @@
+"""Tests for the Jira workflow manager and ticket persistence."""
+
+import pytest
+
+from src.graph.nodes.jira_agent import (
+    JiraAgentError, JiraTransitionData, JiraWorkflowManager, TicketRecordPersister, _select_workflow_action
+)
+from src.graph.state import DecisionType
+
+
+class FlakyStorage:
+    """Storage client whose store() fails a set number of times, checking reads mid-write"""
+
+    def __init__(self, persister, failures=0):
+        self.persister = persister
+        self.failures = failures
+        self.stored = {}
+        self.visible_during_store = []
+
+    def store(self, collection, key, value):
+        self.visible_during_store.append(self.persister.get_ticket(key) is value)
+        if self.failures:
+            self.failures -= 1
+            raise IOError("storage unavailable")
+        self.stored[key] = value
+
+
+def _unflushed_persister(failures=0):
+    persister = TicketRecordPersister()
+    persister.storage_client = FlakyStorage(persister, failures)
+    # Pretend the background flusher is running so tests control flushes
+    persister._flush_thread = object()
+    return persister
+
+
+def test_flush_keeps_record_readable_until_stored():
+    persister = _unflushed_persister()
+    ticket_record = {'ticket_id': 'IT-1', 'status': 'New'}
+    persister.buffer_record(ticket_record)
+
+    persister.flush()
+
+    assert persister.storage_client.visible_during_store == [True]
+    assert persister.storage_client.stored == {'IT-1': ticket_record}
+    assert persister._pending == {} and persister._buffer == {}
+
+
+def test_flush_requeues_failed_write():
+    persister = _unflushed_persister(failures=1)
+    ticket_record = {'ticket_id': 'IT-1', 'status': 'New'}
+    persister.buffer_record(ticket_record)
+
+    persister.flush()
+    assert persister.storage_client.stored == {}
+    assert persister._pending['IT-1'] is ticket_record
+    assert list(persister._buffer) == ['IT-1']
+
+    persister.flush()
+    assert persister.storage_client.stored == {'IT-1': ticket_record}
+    assert persister._pending == {}
+
+
+def test_flush_keeps_newer_record_buffered_during_write():
+    persister = _unflushed_persister()
+    first = {'ticket_id': 'IT-1', 'status': 'New'}
+    second = {'ticket_id': 'IT-1', 'status': 'In Progress'}
+    persister.buffer_record(first)
+
+    def store(collection, key, value):
+        persister.storage_client.stored[key] = value
+        if value is first:
+            persister.buffer_record(second)
+    persister.storage_client.store = store
+
+    persister.flush()
+    assert persister.get_ticket('IT-1') is second
+
+    persister.flush()
+    assert persister.storage_client.stored == {'IT-1': second}
+    assert persister._pending == {}
+
+
+def _closed_ticket_state(ticket_id):
+    return {'ticket_record': {'ticket_id': ticket_id, 'status': 'Closed'}}
+
+
+def test_settled_inputs_are_bounded_lru(monkeypatch):
+    monkeypatch.setattr(JiraWorkflowManager, 'SETTLED_INPUTS_SIZE', 2)
+    manager = JiraWorkflowManager(jira_client=None, ticket_persister=TicketRecordPersister())
+
+    manager.process_workflow_state(_closed_ticket_state('IT-1'))
+    manager.process_workflow_state(_closed_ticket_state('IT-2'))
+    manager.process_workflow_state(_closed_ticket_state('IT-1'))  # refreshes IT-1
+    manager.process_workflow_state(_closed_ticket_state('IT-3'))
+
+    assert list(manager._settled_inputs) == ['IT-1', 'IT-3']
+
+
+class AsyncFakeJiraClient:
+    """Async facade over a FakeJiraClient, as the workflow manager sees an AsyncJiraClient"""
+
+    def __init__(self, client):
+        self.client = client
+        self.config = client.config
+
+    async def create_ticket(self, ticket_data):
+        return self.client.create_ticket(ticket_data)
+
+    async def transition_ticket(self, transition_data):
+        return self.client.transition_ticket(transition_data)
+
+    async def add_comment(self, ticket_id, comment):
+        return self.client.add_comment(ticket_id, comment)
+
+
+def _allowed_request_state(title):
+    return {
+        'user_request': {'title': title, 'category': 'software', 'priority': 'LOW'},
+        'decision_record': {'decision': 'ALLOWED', 'confidence': 0.9, 'citations': []},
+    }
+
+
+def _manager(jira_client):
+    return JiraWorkflowManager(jira_client, TicketRecordPersister())
+
+
+def test_process_batch_creates_new_tickets_in_bulk(fake_jira_client):
+    existing = {'ticket_record': {'ticket_id': 'IT-100', 'status': 'Closed'}}
+    states = [_allowed_request_state('a'), existing, _allowed_request_state('b')]
+
+    results = _manager(fake_jira_client).process_batch(states)
+
+    assert results == states
+    assert [state['ticket_record']['ticket_id'] for state in results] == ['IT-1', 'IT-100', 'IT-2']
+    assert [state['ticket_record']['status'] for state in results] == ['In Progress', 'Closed', 'In Progress']
+    assert fake_jira_client.calls[0] == ('create_tickets_bulk', ('IT-1', 'IT-2'))
+    assert not any(call[0] == 'create_ticket' for call in fake_jira_client.calls)
+
+
+def test_process_batch_falls_back_to_single_create_for_failed_elements(fake_jira_client):
+    bulk_create = fake_jira_client.create_tickets_bulk
+    fake_jira_client.create_tickets_bulk = lambda ticket_datas: [None, *bulk_create(ticket_datas)[1:]]
+    states = [_allowed_request_state('a'), _allowed_request_state('b')]
+
+    results = _manager(fake_jira_client).process_batch(states)
+
+    assert [state['ticket_record']['ticket_id'] for state in results] == ['IT-3', 'IT-2']
+    assert ('create_ticket', 'IT-3', 'IT Support Request: a') in fake_jira_client.calls
+    assert all(state['ticket_record']['status'] == 'In Progress' for state in results)
+
+
+@pytest.mark.parametrize('parallel_workers', [1, 5])
+def test_process_batch_records_a_failing_state_and_keeps_the_others(fake_jira_client, parallel_workers):
+    fake_jira_client.config['parallel_workers'] = parallel_workers
+    add_comment = fake_jira_client.add_comment
+
+    def flaky_add_comment(ticket_id, comment):
+        if ticket_id == 'IT-2':
+            raise JiraAgentError("comment rejected")
+        return add_comment(ticket_id, comment)
+    fake_jira_client.add_comment = flaky_add_comment
+    states = [_allowed_request_state(title) for title in 'abc']
+
+    results = _manager(fake_jira_client).process_batch(states)
+
+    assert results == states
+    assert [state['ticket_record']['status'] for state in results] == ['In Progress'] * 3
+    assert 'errors' not in results[0] and 'errors' not in results[2]
+    assert [error['error_type'] for error in results[1]['errors']] == ['jira_error']
+    assert 'comment rejected' in results[1]['errors'][0]['message']
+
+
+def test_transition_tickets_reports_raising_transition_as_failed(fake_jira_client):
+    transition_ticket = fake_jira_client.transition_ticket
+
+    def flaky_transition(transition_data):
+        if transition_data.ticket_id == 'IT-1':
+            raise JiraAgentError("transition rejected")
+        return transition_ticket(transition_data)
+    fake_jira_client.transition_ticket = flaky_transition
+    transitions = [JiraTransitionData(f"IT-{n}", 'Close', '', None, None) for n in range(1, 4)]
+
+    assert _manager(fake_jira_client).transition_tickets(transitions) == [False, True, True]
+
+
+def test_transition_tickets_returns_results_in_input_order(fake_jira_client):
+    fake_jira_client.failing_transitions = {'IT-2'}
+    transitions = [JiraTransitionData(f"IT-{n}", 'Close', '', None, None) for n in range(1, 5)]
+
+    assert _manager(fake_jira_client).transition_tickets(transitions) == [True, False, True, True]
+
+
+def test_transition_tickets_runs_sequentially_when_parallelism_disabled(fake_jira_client):
+    fake_jira_client.config['parallel_workers'] = 1
+    transitions = [JiraTransitionData(f"IT-{n}", 'Close', '', None, None) for n in range(1, 4)]
+
+    assert _manager(fake_jira_client).transition_tickets(transitions) == [True, True, True]
+    assert [call[1] for call in fake_jira_client.calls] == ['IT-1', 'IT-2', 'IT-3']
+
+
+@pytest.mark.asyncio
+async def test_aprocess_batch_processes_each_state(fake_jira_client):
+    fake_jira_client.failing_transitions = {'IT-2'}
+    manager = _manager(AsyncFakeJiraClient(fake_jira_client))
+    states = [_allowed_request_state('a'), _allowed_request_state('b')]
+
+    results = await manager.aprocess_batch(states)
+
+    assert results == states
+    records = {state['ticket_record']['ticket_id']: state['ticket_record'] for state in results}
+    assert records['IT-1']['status'] == 'In Progress'
+    # A failed transition leaves the new ticket persisted as New, unsettled for a retry
+    assert records['IT-2']['status'] == 'New'
+    assert manager.ticket_persister.get_ticket('IT-2') is records['IT-2']
+    assert 'IT-2' not in manager._settled_inputs
+    assert ('add_comment', 'IT-2') not in [call[:2] for call in fake_jira_client.calls]
+
+
+def test_cached_workflow_action_is_read_only():
+    action = _select_workflow_action('New', DecisionType.ALLOWED, False, 0, None)
+
+    with pytest.raises(TypeError):
+        action['target_status'] = 'Closed'
+    assert _select_workflow_action('New', DecisionType.ALLOWED, False, 0, None)['target_status'] == 'In Progress'
+
+
+def test_in_memory_ticket_records_are_bounded(monkeypatch):
+    monkeypatch.setattr(TicketRecordPersister, 'TICKET_RECORDS_SIZE', 2)
+    persister = TicketRecordPersister()
+
+    for n in range(1, 4):
+        persister.buffer_record({'ticket_id': f"IT-{n}", 'status': 'New'})
+    persister.persist_ticket({'ticket_id': 'IT-2', 'status': 'In Progress'})
+    persister.persist_ticket({'ticket_id': 'IT-4', 'status': 'New'})
+
+    assert list(persister.ticket_records) == ['IT-2', 'IT-4']
+    assert persister.get_ticket('IT-1') is None
+    assert persister.get_ticket('IT-2')['status'] == 'In Progress'
@@ -0,0 +1,192 @@
+"""Tests for the planner node."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.graph.nodes import planner
+from src.graph.nodes.planner import JSONResponseParser, PlanningInput
+
+
+def _plan_data(category='software'):
+    """A valid plan as produced by the mock planner response"""
+    input_data = PlanningInput(
+        user_request={'category': category, 'title': 'Install VS Code'},
+        decision_record={'decision': 'ALLOWED'},
+        retrieved_docs=[], past_tickets_features=[], employee={}
+    )
+    return JSONResponseParser()._extract_json(planner._PROMPT_CALLER._generate_mock_response(input_data))
+
+
+def test_parse_response_accepts_mock_plan():
+    success, data, errors = JSONResponseParser().parse_response(json.dumps(_plan_data()))
+
+    assert success and errors == []
+    assert data['classification'] == 'ALLOWED'
+
+
+@pytest.mark.parametrize('field', ['classification', 'priority'])
+@pytest.mark.parametrize('value', [['ALLOWED'], {'level': 'HIGH'}, None, 3])
+def test_parse_response_reports_non_string_enum_values(field, value):
+    data = _plan_data()
+    data[field] = value
+
+    success, _, errors = JSONResponseParser().parse_response(json.dumps(data))
+
+    assert not success
+    assert len(errors) == 1 and errors[0].startswith(f"Invalid {field}")
+
+
+@pytest.mark.parametrize('actor', [['it_agent'], {'name': 'it_agent'}])
+def test_parse_response_reports_unhashable_actor(actor):
+    data = _plan_data()
+    data['steps'][0]['actor'] = actor
+
+    success, _, errors = JSONResponseParser().parse_response(json.dumps(data))
+
+    assert not success
+    assert errors == [f"Step 0 has invalid actor: {actor}. Must be one of {sorted(JSONResponseParser.ACTORS)}"]
+
+
+def _access_request_state(n=1):
+    """A state whose mock plan needs manager approval"""
+    return {
+        'user_request': {'request_id': f"REQ-{n}", 'title': f"VPN access {n}", 'category': 'access'},
+        'decision_record': {'decision': 'REQUIRES_APPROVAL'},
+        'ticket_record': {'ticket_id': f"IT-{n}"},
+        'employee': {'employee_id': 'emp_1'},
+    }
+
+
+def _mock_response(state):
+    return planner._PROMPT_CALLER._generate_mock_response(planner._planning_input(state))
+
+
+@pytest.fixture
+def events(monkeypatch):
+    """Record plan persistence, ticket updates and approval emails, in order"""
+    recorded = []
+
+    def persist_plan(self, plan_record, ticket_id=None, request_id=None, created_by=None):
+        recorded.append(('persist_plan', plan_record['plan_id']))
+        return f"stored_{plan_record['plan_id']}"
+
+    monkeypatch.setattr(planner.PlanRepository, 'persist_plan', persist_plan)
+    monkeypatch.setattr(planner, 'update_ticket_status',
+                        lambda ticket_id, status, reason=None: recorded.append(('update_ticket_status', ticket_id, status)))
+    monkeypatch.setattr(planner._APPROVAL, 'send_approval_email',
+                        lambda email_draft, ticket_id: recorded.append(('send_approval_email', ticket_id)) or True)
+    return recorded
+
+
+@pytest.fixture
+def async_planner_response(monkeypatch):
+    async def acall_planner(input_data, target_model):
+        return _mock_response({'user_request': input_data.user_request, 'decision_record': input_data.decision_record})
+    monkeypatch.setattr(planner._PROMPT_CALLER, 'acall_planner', acall_planner)
+
+
+@pytest.mark.asyncio
+async def test_planner_node_async_persists_before_side_effects(events, async_planner_response):
+    state = await planner.planner_node_async(_access_request_state())
+
+    assert events[0][0] == 'persist_plan'
+    assert sorted(event[0] for event in events[1:]) == ['send_approval_email', 'update_ticket_status']
+    plan_id = state['plan_record']['plan_id']
+    assert plan_id == f"stored_{events[0][1]}"
+    assert state['metadata']['planning']['plan_id'] == plan_id
+    assert state['metadata']['planning']['requires_approval'] is True
+    assert state['ticket_record']['custom_fields']['requires_approval'] is True
+    assert 'errors' not in state
+
+
+@pytest.mark.asyncio
+async def test_planner_node_async_skips_side_effects_when_persist_fails(events, async_planner_response, monkeypatch):
+    persist_plan = planner.PlanRepository.persist_plan
+    attempts = []
+
+    def failing_first_persist(self, plan_record, *owner):
+        attempts.append(plan_record['plan_id'])
+        if len(attempts) == 1:
+            raise RuntimeError("plan store unavailable")
+        return persist_plan(self, plan_record, *owner)
+    monkeypatch.setattr(planner.PlanRepository, 'persist_plan', failing_first_persist)
+
+    state = await planner.planner_node_async(_access_request_state())
+
+    assert ('send_approval_email', 'IT-1') not in events
+    assert state['plan_record']['plan_id'].startswith('stored_emergency_plan_')
+    assert state['errors'][-1]['error_type'] == 'planning_error'
+    assert 'planning' not in state.get('metadata', {})
+
+
+def test_plan_many_batches_llm_call_and_persistence(events, monkeypatch):
+    states = [_access_request_state(n) for n in range(1, 4)]
+    monkeypatch.setattr(planner._PROMPT_CALLER, 'call_planner_many', lambda inputs, target_models: [
+        _mock_response(states[0]), RuntimeError("llm unavailable"), "no plan here"
+    ])
+    saved_batches = []
+
+    def save_plans_from_records(entries):
+        saved_batches.append([(record['plan_id'], *owner) for record, *owner in entries])
+        return [SimpleNamespace(plan_id=f"db_{record['plan_id']}") for record, *_ in entries]
+    monkeypatch.setattr(planner, 'save_plans_from_records', save_plans_from_records)
+
+    results = planner.plan_many(states)
+
+    assert results == states
+    # The good plan and the fallback plan share one transaction; the failed call gets an emergency plan
+    assert len(saved_batches) == 1
+    assert [owner for _, *owner in saved_batches[0]] == [['IT-1', 'REQ-1', 'emp_1'], ['IT-3', 'REQ-3', 'emp_1']]
+    assert results[0]['plan_record']['plan_id'] == f"db_{saved_batches[0][0][0]}"
+    assert results[0]['metadata']['planning']['requires_approval'] is True
+    assert results[1]['plan_record']['plan_id'].startswith('stored_emergency_plan_')
+    assert results[1]['errors'][-1]['error_type'] == 'planning_error'
+    assert results[2]['plan_record']['request_summary'] == "Fallback plan due to parsing errors"
+    assert results[2]['errors'][-1]['error_type'] == 'planning_parsing_error'
+    assert ('send_approval_email', 'IT-1') in events
+    assert all(event[1] != 'IT-2' for event in events if event[0] == 'send_approval_email')
+
+
+def test_plan_many_falls_back_to_emergency_plans_when_llm_fails(events, monkeypatch):
+    def call_planner_many(inputs, target_models):
+        raise RuntimeError("llm unavailable")
+    monkeypatch.setattr(planner._PROMPT_CALLER, 'call_planner_many', call_planner_many)
+    states = [_access_request_state(n) for n in range(1, 3)]
+
+    results = planner.plan_many(states)
+
+    assert all(state['plan_record']['plan_id'].startswith('stored_emergency_plan_') for state in results)
+    assert [event for event in events if event[0] == 'update_ticket_status'] == [
+        ('update_ticket_status', 'IT-1', 'waiting_for_approval'),
+        ('update_ticket_status', 'IT-2', 'waiting_for_approval'),
+    ]
+
+
+def test_fallback_and_emergency_plans_use_lists(events, monkeypatch):
+    states = [_access_request_state(n) for n in range(1, 3)]
+    monkeypatch.setattr(planner._PROMPT_CALLER, 'call_planner_many', lambda inputs, target_models: [
+        RuntimeError("llm unavailable"), "no plan here"
+    ])
+
+    emergency, fallback = (state['plan_record'] for state in planner.plan_many(states))
+
+    for plan in (emergency, fallback):
+        assert isinstance(plan['approval_workflow']['approvers'], list)
+        assert isinstance(plan['approval_workflow']['escalation_path'], list)
+        assert all(isinstance(plan['email_draft'][key], list) for key in ('recipients', 'cc', 'attachments'))
+        assert isinstance(plan['risk_assessment']['risks'], list)
+        assert isinstance(plan['risk_assessment']['mitigation_strategies'], list)
+    # Each plan has its own copy; the shared constants stay intact
+    emergency['approval_workflow']['approvers'].append('someone')
+    assert planner._EMERGENCY_APPROVAL_WORKFLOW['approvers'] == ('Emergency_Team',)
+
+
+def test_plan_steps_use_lists_for_missing_sequences():
+    step = planner._plan_step({'step_id': 's1', 'order': 1, 'description': 'd', 'actor': 'it_agent',
+                               'actor_details': '', 'estimated_duration': 5})
+
+    assert step['required_tools'] == step['preconditions'] == step['postconditions'] == step['dependencies'] == []
+    assert all(isinstance(step[key], list)
+               for key in ('required_tools', 'preconditions', 'postconditions', 'dependencies'))
@@ -0,0 +1,146 @@
+"""Tests for the retrieve node."""
+
+import random
+
+import pytest
+
+from src.graph.nodes.retrieve import DocumentRetriever, _JaccardIndex
+
+
+def _jaccard(a, b):
+    """Pairwise Jaccard similarity, as the section deduplication originally computed it"""
+    union = a | b
+    return len(a & b) / len(union) if union else 0.0
+
+
+def _exhaustive_dedup(token_sets, threshold):
+    """Reference deduplication: compare each set with every set kept so far"""
+    kept = []
+    for tokens in token_sets:
+        if not any(_jaccard(tokens, other) > threshold for other in kept):
+            kept.append(tokens)
+    return kept
+
+
+def _indexed_dedup(token_sets, threshold):
+    index = _JaccardIndex(threshold)
+    kept = []
+    for tokens in token_sets:
+        if not index.has_similar(tokens):
+            index.add(tokens)
+            kept.append(tokens)
+    return kept
+
+
+@pytest.mark.parametrize('threshold', [0.0, 0.3, 0.5, 0.8, 0.9, 1.0])
+@pytest.mark.parametrize('seed', range(5))
+def test_jaccard_index_matches_exhaustive_pairwise(threshold, seed):
+    rng = random.Random(seed)
+    vocabulary = [f"w{n}" for n in range(12)]
+    base_sets = [frozenset(rng.sample(vocabulary, rng.randint(0, 8))) for _ in range(20)]
+    # Near-duplicates of earlier sets: one token dropped or swapped
+    token_sets = list(base_sets)
+    for tokens in base_sets:
+        variant = set(tokens)
+        if variant and rng.random() < 0.5:
+            variant.discard(rng.choice(sorted(variant)))
+        else:
+            variant.add(rng.choice(vocabulary))
+        token_sets.append(frozenset(variant))
+    rng.shuffle(token_sets)
+
+    assert _indexed_dedup(token_sets, threshold) == _exhaustive_dedup(token_sets, threshold)
+
+
+def test_jaccard_index_threshold_is_exclusive():
+    stored = frozenset('abcde')
+    index = _JaccardIndex(0.8)
+    index.add(stored)
+
+    # 4/5 == 0.8 exactly is not a duplicate; 5/6 > 0.8 is
+    assert not index.has_similar(frozenset('abcd'))
+    assert index.has_similar(frozenset('abcdef'))
+    assert index.has_similar(stored)
+
+
+@pytest.mark.parametrize('threshold', [0.2, 0.5, 0.75])
+def test_jaccard_index_boundary_ratios(threshold):
+    # Sets whose similarity to the stored set is exactly the threshold
+    index = _JaccardIndex(threshold)
+    index.add(frozenset(f"t{n}" for n in range(20)))
+    at_threshold = frozenset(f"t{n}" for n in range(int(20 * threshold)))
+
+    assert _jaccard(at_threshold, frozenset(f"t{n}" for n in range(20))) == threshold
+    assert not index.has_similar(at_threshold)
+
+
+def test_jaccard_index_empty_sets_are_never_duplicates():
+    index = _JaccardIndex(0.8)
+    assert not index.has_similar(frozenset())
+
+    index.add(frozenset())
+    index.add(frozenset('ab'))
+    assert not index.has_similar(frozenset())
+    assert _indexed_dedup([frozenset(), frozenset(), frozenset('a')], 0.8) == [frozenset(), frozenset(), frozenset('a')]
+
+
+class CountingKnowledgeBase:
+    """Knowledge-base client that counts searches"""
+
+    def __init__(self):
+        self.searches = []
+
+    def search(self, query, max_results=10):
+        self.searches.append((query, max_results))
+        return [{'doc_id': f"{query}-{len(self.searches)}", 'content': query}]
+
+
+def test_retriever_cache_serves_normalized_query_until_ttl(clock):
+    kb = CountingKnowledgeBase()
+    retriever = DocumentRetriever(kb)
+
+    first = retriever.retrieve_documents('VPN  Access')
+    clock.now += DocumentRetriever.CACHE_TTL_SECONDS - 1
+    assert retriever.retrieve_documents('vpn access') == first
+    assert len(kb.searches) == 1
+
+    clock.now += 1
+    refreshed = retriever.retrieve_documents('vpn access')
+    assert refreshed != first
+    assert len(kb.searches) == 2
+
+
+def test_retriever_cache_returns_copies(clock):
+    retriever = DocumentRetriever(CountingKnowledgeBase())
+
+    retriever.retrieve_documents('vpn').clear()
+
+    assert len(retriever.retrieve_documents('vpn')) == 1
+
+
+def test_retriever_cache_evicts_least_recently_used(clock, monkeypatch):
+    monkeypatch.setattr(DocumentRetriever, 'CACHE_SIZE', 2)
+    kb = CountingKnowledgeBase()
+    retriever = DocumentRetriever(kb)
+
+    retriever.retrieve_documents('a')
+    retriever.retrieve_documents('b')
+    retriever.retrieve_documents('a')  # 'b' is now least recently used
+    retriever.retrieve_documents('c')
+    assert list(retriever.cache) == [('a', 10), ('c', 10)]
+
+    retriever.retrieve_documents('a')
+    retriever.retrieve_documents('b')
+    assert [query for query, _ in kb.searches] == ['a', 'b', 'c', 'b']
+
+
+def test_retriever_cache_bypass_refreshes_entry(clock):
+    kb = CountingKnowledgeBase()
+    retriever = DocumentRetriever(kb)
+
+    retriever.retrieve_documents('vpn')
+    fresh = retriever.retrieve_documents('vpn', use_cache=False)
+
+    assert len(kb.searches) == 2
+    assert retriever.retrieve_documents('vpn') == fresh
+    assert retriever.retrieve_documents('vpn', max_results=5) != fresh